@@ -7,309 +7,622 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.dataset as ds
+import pyarrow.csv as pacsv
 import time
 import random
 import logging
 from fake_useragent import UserAgent
 import json
+from array import array
+from itertools import islice, repeat
+from operator import itemgetter
+import codecs
+import gzip
+import contextlib
 import re
-from urllib.parse import urljoin, urlparse, quote
 import os
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import deque
 from tqdm import tqdm
-from datetime import datetime
-import pickle
+import glob
+
+# 浏览器渲染 (可选): 列表页通过HTTP直接抓取，只有需要执行JS的页面才用到WebDriver
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+# 品牌匹配加速 (可选)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# URL去重布隆过滤器 (可选)
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+# HTTP/2客户端 (可选，需要 httpx[http2])
+try:
+    import httpx
+    import h2  # noqa: F401  httpx的HTTP/2支持依赖h2
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# 检查点URL日志的JSON编解码加速 (可选)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # 设置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class CarDataScraper:
-    """汽车数据爬虫类 - 车168专版"""
+# 卡片文本中的数字片段
+_NUMBER_PATTERN = re.compile(r'([\d.]+)')
+
+# 卡片字段提取规则: (规则键, 数字前的标签, 数字后的单位, 是否取末尾4位数字作为年份)
+# 每条规则等价于一个原先单独执行的正则，如 ('condition', '车况', '分') 对应 r'车况[：:]?([\d.]+)分'
+_CARD_FIELD_RULES = (
+    ('price', None, '万', False),
+    ('year_kuan', None, '款', True),
+    ('year_nian', None, '年', True),
+    ('year_dash', None, '-', True),
+    ('mileage_wan', None, '万公里', False),
+    ('mileage_km', None, '公里', False),
+    ('displacement', None, ('L', 'T'), False),
+    ('condition', '车况', '分', False),
+    ('score', '评分', None, False),
+    ('consumption_label', '油耗', 'L', False),
+    ('consumption', None, 'L/100km', False),
+    ('max_speed_label', '最高时速', None, False),
+    ('max_speed', None, 'km/h', False),
+    ('acceleration_label', '加速', '秒', False),
+    ('acceleration', '0-100km/h', 's', False),
+)
+_CARD_LABEL_MAX_LEN = max(len(label) for _, label, _, _ in _CARD_FIELD_RULES if label)
+
+# 已知品牌列表，越靠前优先级越高
+_BRANDS = [
+    '奥迪', '宝马', '奔驰', '大众', '丰田', '本田', '日产', '马自达', '现代', '起亚', 
+    '福特', '雪佛兰', '别克', '凯迪拉克', '沃尔沃', '捷豹', '路虎', '保时捷', '特斯拉',
+    '比亚迪', '吉利', '长城', '奇瑞', '长安', '荣威', '名爵', '传祺', '红旗', '领克',
+    '蔚来', '小鹏', '理想', '威马', '零跑', '哪吒', '极氪', '岚图', '高合', '智己',
+    '雷克萨斯', '英菲尼迪', '讴歌', '林肯', '凯迪拉克', '克莱斯勒', 'Jeep', '道奇',
+    '菲亚特', '阿尔法罗密欧', '玛莎拉蒂', '法拉利', '兰博基尼', '宾利', '劳斯莱斯',
+    '阿斯顿马丁', '迈凯伦', '布加迪', '帕加尼', '柯尼塞格', '五菱', '宝骏', '东风',
+    '一汽', '北汽', '江淮', '海马', '众泰', '力帆', '观致', '启辰', '思铭', '理念'
+]
+
+# 城市代码 → 中文名
+_CITY_NAME_MAP = {
+    'beijing': '北京', 'bj': '北京',
+    'shanghai': '上海', 'sh': '上海',
+    'guangzhou': '广州', 'gz': '广州',
+    'shenzhen': '深圳', 'sz': '深圳',
+    'hangzhou': '杭州', 'hz': '杭州',
+    'nanjing': '南京', 'nj': '南京',
+    'wuhan': '武汉', 'wh': '武汉',
+    'chengdu': '成都', 'cd': '成都',
+    'xian': '西安', 'xa': '西安',
+    'chongqing': '重庆', 'cq': '重庆',
+    'tianjin': '天津', 'tj': '天津',
+    'qingdao': '青岛', 'qd': '青岛',
+    'dalian': '大连', 'dl': '大连',
+    'suzhou': '苏州', 'su': '苏州',
+    'dongguan': '东莞', 'dg': '东莞',
+    'foshan': '佛山', 'fs': '佛山',
+    'zhengzhou': '郑州', 'zz': '郑州',
+    'changsha': '长沙', 'cs': '长沙',
+    'jinan': '济南', 'jn': '济南',
+    'hefei': '合肥', 'hf': '合肥',
+    'shenyang': '沈阳', 'sy': '沈阳',
+    'changchun': '长春', 'cc': '长春',
+    'harbin': '哈尔滨', 'hrb': '哈尔滨',
+    'taiyuan': '太原', 'ty': '太原',
+    'taizhou': '台州', 'tz': '台州',
+    'ningbo': '宁波', 'nb': '宁波',
+    'wuxi': '无锡', 'wx': '无锡',
+    'changzhou': '常州',
+    'xuzhou': '徐州',
+    'yantai': '烟台',
+    'weifang': '潍坊',
+    'linyi': '临沂',
+    'zibo': '淄博',
+    'weihai': '威海',
+    'dongying': '东营',
+    'binzhou': '滨州',
+    'dezhou': '德州',
+    'liaocheng': '聊城',
+    'heze': '菏泽',
+    'zaozhuang': '枣庄',
+    'jining': '济宁',
+    'taian': '泰安',
+    'rizhao': '日照',
+    'laiwu': '莱芜',
+    'huaian': '淮安',
+    'yancheng': '盐城',
+    'yangzhou': '扬州',
+    'zhenjiang': '镇江',
+    'suqian': '宿迁',
+    'lianyungang': '连云港',
+    'shaoxing': '绍兴',
+    'jiaxing': '嘉兴',
+    'huzhou': '湖州',
+    'lishui': '丽水',
+    'quzhou': '衢州',
+    'zhoushan': '舟山',
+    'taizhou_zj': '台州',
+    'wenzhou': '温州',
+    'kunming': '昆明', 'km': '昆明',
+    'lanzhou': '兰州', 'lz': '兰州',
+    'urumqi': '乌鲁木齐',
+    'guiyang': '贵阳', 'gy': '贵阳',
+    'nanning': '南宁', 'nn': '南宁',
+    'haikou': '海口', 'hk': '海口',
+    'shijiazhuang': '石家庄', 'sjz': '石家庄',
+    'hohhot': '呼和浩特'
+}
+
+# 颜色、车型关键词及纯电品牌
+_COLORS = ('白色', '黑色', '银色', '灰色', '红色', '蓝色', '金色', '棕色', '绿色', '黄色', '橙色', '紫色')
+_SUV_KEYWORDS = ('SUV', 'X', 'Q', 'GL', 'GLE', 'RX', 'NX', 'CX', 'CR', 'RAV', 'XC', 'QX')
+_MPV_KEYWORDS = ('MPV', 'GL8', 'ODYSSEY', 'SIENNA', 'ALPHARD', 'ELYSION')
+# 关键词合并为一个正则，search一次等价于逐个关键词做子串判断
+_SUV_PATTERN = re.compile('|'.join(map(re.escape, _SUV_KEYWORDS)))
+_MPV_PATTERN = re.compile('|'.join(map(re.escape, _MPV_KEYWORDS)))
+_EV_BRANDS = frozenset(['特斯拉', '蔚来', '小鹏', '理想', '威马', '零跑', '哪吒'])
+
+# 列表页/卡片元素的XPath (等价于原先的CSS选择器，按顺序尝试)
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+_CARD_XPATHS = [
+    etree.XPath(f"//li[{_HAS_CLASS.format('cards-li')}]"),   # li.cards-li
+    etree.XPath(f"//*[{_HAS_CLASS.format('list-item')}]"),   # .list-item
+    etree.XPath(f"//*[{_HAS_CLASS.format('car-item')}]"),    # .car-item
+    etree.XPath(f"//*[{_HAS_CLASS.format('item-info')}]"),   # .item-info
+]
+_TITLE_XPATHS = [
+    etree.XPath("(.//*[@carname])[1]"),                          # [carname]
+    etree.XPath("(.//h4)[1]"),                                   # h4
+    etree.XPath(f"(.//*[{_HAS_CLASS.format('card-name')}])[1]"),  # .card-name
+    etree.XPath(f"(.//*[{_HAS_CLASS.format('car-name')}])[1]"),   # .car-name
+    etree.XPath(f"(.//*[{_HAS_CLASS.format('title')}])[1]"),      # .title
+]
+_TEXT_XPATH = etree.XPath(".//text()")
+
+# 品牌自动机: 一次扫描标题找出所有品牌，值为 (优先级, 品牌)
+_BRAND_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _BRAND_AUTOMATON = ahocorasick.Automaton()
+    for _index, _brand in reversed(list(enumerate(_BRANDS))):
+        _BRAND_AUTOMATON.add_word(_brand, (_index, _brand))
+    _BRAND_AUTOMATON.make_automaton()
+
+# 记录字段及顺序，可选字段在全部缺失时不输出
+_RECORD_FIELDS = (
+    '品牌', '车型', '价格', '年份', '里程', '燃料类型', '变速器', '车辆类型', '数据来源', '所在城市',
+    '排量', '颜色', '车况评分', '油耗', '最高时速', '加速时间', '车龄'
+)
+_FIELD_INDEX = {field: index for index, field in enumerate(_RECORD_FIELDS)}
+# 判定重复车源的字段，爬取时和预处理时使用同一组
+_DEDUP_FIELDS = ('品牌', '车型', '年份', '里程', '价格')
+_DEDUP_KEY = itemgetter(*(_FIELD_INDEX[field] for field in _DEDUP_FIELDS))
+_OPTIONAL_FIELDS = frozenset(['排量', '颜色', '车况评分', '油耗', '最高时速', '加速时间'])
+# 取值集合很小的字符串字段: 缓冲区内驻留为同一对象，DataFrame中转换为分类类型
+_CATEGORICAL_FIELDS = frozenset([
+    '品牌', '燃料类型', '变速器', '车辆类型', '数据来源', '所在城市', '颜色'
+])
+# 价格区间/里程区间在转换DataFrame时按整列二分查找生成 (区间左闭右开)
+_PRICE_BINS = np.array([10, 20, 30, 50, 100])
+_PRICE_LABELS = ['10万以下', '10-20万', '20-30万', '30-50万', '50-100万', '100万以上']
+_MILEAGE_BINS = np.array([10000, 30000, 50000, 100000])
+_MILEAGE_LABELS = ['1万公里以下', '1-3万公里', '3-5万公里', '5-10万公里', '10万公里以上']
+_FIELD_DTYPES = {
+    '价格': np.float64, '年份': np.int64, '里程': np.int64, '车龄': np.int64,
+    '排量': np.float64, '车况评分': np.float64, '油耗': np.float64,
+    '最高时速': np.float64, '加速时间': np.float64,
+}
+# 数值字段在缓冲区中统一使用float64定长数组(array('d'))，不再逐个装箱为Python对象，
+# 缺失值记为NaN；整数字段转换为Arrow时NaN变为null，转换为DataFrame时无缺失则还原为int64
+_ARROW_SCHEMA = pa.schema([
+    (field, pa.float64() if _FIELD_DTYPES.get(field) is np.float64
+     else pa.int64() if _FIELD_DTYPES.get(field) is np.int64
+     else pa.string())
+    for field in _RECORD_FIELDS
+])
+# 预处理的有效行条件，扫描parquet分片时下推执行 (缺失值比较结果为null，按不满足处理)
+_VALID_ROW_FILTER = (
+    ds.field('品牌').is_valid() & ds.field('车型').is_valid()
+    & (ds.field('价格') >= 0.1) & (ds.field('价格') <= 2000)
+    & (ds.field('年份') >= 2000) & (ds.field('年份') <= 2025)
+    & (ds.field('里程') >= 0) & (ds.field('里程') <= 1000000)
+)
+
+class CarRecordBuffer:
+    """按列存储的爬取数据
+    
+    数值字段为定长类型数组(缺失值记为NaN)，分类字段按字典编码保存为整数编码数组(缺失值记为-1)，
+    其余字段为列表。转换为DataFrame/Arrow时直接使用列数组，避免 pd.DataFrame(list_of_dicts)
+    逐行推断结构。
+    spill() 把内存中的行写入parquet分片后清空，内存中只保留尚未写出的一批
+    """
     
     def __init__(self):
-        self.ua = UserAgent()
-        self.session = requests.Session()
-        self.data = []
-        self.driver = None
-        self.scraped_urls = set()  # 防重复爬取
-        
-        # 动态延迟配置
-        self.request_delay = (0.5, 2.0)
-        self.page_delay = (1.0, 3.0)
-        
-        # 设置通用请求头
-        self.headers = {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
-        }
-        self.session.headers.update(self.headers)
-        
-        # 代理池
-        self.proxies = []
-        self.proxy_index = 0
-        self.load_proxies_from_file()
-        
-        # 检查点文件
-        self.checkpoint_file = 'scraper_checkpoint.pkl'
-        
-    def load_checkpoint(self):
-        """加载检查点"""
-        try:
-            if os.path.exists(self.checkpoint_file):
-                with open(self.checkpoint_file, 'rb') as f:
-                    checkpoint = pickle.load(f)
-                    self.data = checkpoint.get('data', [])
-                    self.scraped_urls = checkpoint.get('scraped_urls', set())
-                    logger.info(f"从检查点恢复: {len(self.data)} 条数据, {len(self.scraped_urls)} 个已爬取URL")
-                    return True
-        except Exception as e:
-            logger.warning(f"加载检查点失败: {e}")
-        return False
+        self.columns = self._new_columns()
+        # 分类字段的字典: 取值→编码，以及按编码排列的取值
+        self._interns = tuple({} if field in _CATEGORICAL_FIELDS else None for field in _RECORD_FIELDS)
+        self._categories = tuple([] if field in _CATEGORICAL_FIELDS else None for field in _RECORD_FIELDS)
+        self._size = 0
+        self._part_files = []  # 已写出的parquet分片
+        self._spilled_rows = 0
     
-    def save_checkpoint(self):
-        """保存检查点"""
-        try:
-            checkpoint = {
-                'data': self.data,
-                'scraped_urls': self.scraped_urls,
-                'timestamp': datetime.now()
-            }
-            with open(self.checkpoint_file, 'wb') as f:
-                pickle.dump(checkpoint, f)
-            logger.info(f"检查点已保存: {len(self.data)} 条数据")
-        except Exception as e:
-            logger.warning(f"保存检查点失败: {e}")
+    def __len__(self):
+        return self._spilled_rows + self._size
     
-    def setup_driver(self):
-        """设置Selenium WebDriver"""
-        if self.driver is None:
-            try:
-                options = Options()
-                options.add_argument('--headless=new')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_argument('--window-size=1920,1080')
-                options.add_argument('--disable-images')
-                options.add_argument('--disable-extensions')
-                options.add_argument('--disable-popup-blocking')
-                options.add_argument(f'--user-agent={self.ua.random}')
-                options.add_experimental_option('useAutomationExtension', False)
-                options.add_experimental_option('excludeSwitches', ['enable-automation'])
-
-                self.driver = webdriver.Chrome(options=options)
-                self.driver.set_page_load_timeout(30)
-                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                    "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-                })
-                logger.info("WebDriver 初始化成功")
-                return True
-            except Exception as e:
-                logger.error(f"WebDriver 初始化失败: {str(e)}")
-                return False
+    @property
+    def pending_rows(self):
+        """内存中尚未写出的行数"""
+        return self._size
+    
+    def _new_columns(self):
+        """创建空列: 数值字段为类型数组，分类字段为编码数组，其余为列表"""
+        return {field: array('d') if field in _FIELD_DTYPES
+                else array('i') if field in _CATEGORICAL_FIELDS else []
+                for field in _RECORD_FIELDS}
+    
+    def append(self, row):
+        """追加一条记录 (按 _RECORD_FIELDS 排列的元组)"""
+        self.extend((row,))
+    
+    def extend(self, rows):
+        """批量追加记录: 整批按列转置后逐列extend"""
+        rows = list(rows)
+        if not rows:
+            return
+        for index, (column, values) in enumerate(zip(self.columns.values(), zip(*rows))):
+            if self._interns[index] is not None:
+                values = self._encode(index, values)
+            elif type(column) is array and None in values:
+                values = [np.nan if value is None else value for value in values]
+            column.extend(values)
+        self._size += len(rows)
+    
+    def _encode(self, index, values):
+        """分类取值转换为编码，新取值追加到字典末尾"""
+        interns = self._interns[index]
+        categories = self._categories[index]
+        for value in set(values):
+            if value is not None and value not in interns:
+                interns[value] = len(categories)
+                categories.append(value)
+        return map(interns.get, values, repeat(-1))
+    
+    def _set_column(self, field, values):
+        """整列写入: 数值字段接收numpy数组，分类字段编码后写入"""
+        if field in _FIELD_DTYPES:
+            values = np.asarray(values, dtype=np.float64)
+            self.columns[field] = array('d', values.tobytes())
+        elif field in _CATEGORICAL_FIELDS:
+            index = _FIELD_INDEX[field]
+            self._interns[index].clear()
+            self._categories[index].clear()
+            self.columns[field] = array('i', self._encode(index, values))
+        else:
+            self.columns[field] = values
+    
+    def _set_categorical(self, field, codes, categories):
+        """直接写入分类字段的编码(缺失为-1)和按编码排列的取值"""
+        index = _FIELD_INDEX[field]
+        self._categories[index][:] = categories
+        self._interns[index].clear()
+        self._interns[index].update((value, code) for code, value in enumerate(categories))
+        self.columns[field] = array('i', np.asarray(codes, dtype=np.intc).tobytes())
+    
+    def _view(self, field):
+        """数值列/分类编码列的numpy视图(不复制，缓冲区追加数据前有效)"""
+        dtype = np.intc if field in _CATEGORICAL_FIELDS else np.float64
+        return np.frombuffer(self.columns[field], dtype=dtype)
+    
+    def _is_empty_column(self, field):
+        """该列是否全部缺失"""
+        if field in _FIELD_DTYPES:
+            return bool(np.isnan(self._view(field)).all())
+        if field in _CATEGORICAL_FIELDS:
+            return bool((self._view(field) < 0).all())
+        return all(value is None for value in self.columns[field])
+    
+    def _column_array(self, field):
+        """把列转换为对应类型的数组，分类字段由编码直接构建pd.Categorical"""
+        if field in _CATEGORICAL_FIELDS:
+            categorical = pd.Categorical.from_codes(
+                self._view(field).copy(), categories=self._categories[_FIELD_INDEX[field]]
+            ).remove_unused_categories()
+            # 与按取值构建时一致，类别按字典序排列
+            return categorical.reorder_categories(sorted(categorical.categories))
+        if field in _FIELD_DTYPES:
+            values = self._view(field).copy()
+            # 与按记录构建DataFrame时一致: 整数字段无缺失为int64，有缺失为float64
+            if _FIELD_DTYPES[field] is np.int64 and not np.isnan(values).any():
+                return values.astype(np.int64)
+            return values
+        return np.asarray(self.columns[field], dtype=object)
+    
+    def to_dataframe(self):
+        """转换为DataFrame"""
+        if self._part_files:
+            return CarRecordBuffer.from_arrow(self.to_table()).to_dataframe()
+        
+        data = {}
+        for field in _RECORD_FIELDS:
+            if field in _OPTIONAL_FIELDS and self._is_empty_column(field):
+                continue
+            data[field] = self._column_array(field)
+        data['价格区间'] = self._range_column(data['价格'], _PRICE_BINS, _PRICE_LABELS)
+        data['里程区间'] = self._range_column(data['里程'], _MILEAGE_BINS, _MILEAGE_LABELS)
+        return pd.DataFrame(data)
+    
+    def _range_column(self, values, bins, labels):
+        """按分界点把数值列映射为区间标签，缺失值的区间也为缺失"""
+        codes = np.searchsorted(bins, values, side='right')
+        codes[np.isnan(values)] = -1
+        return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    
+    def write_csv(self, filename):
+        """逐个分片用PyArrow的CSV写出器(C++实现)写出，不构建DataFrame
+        
+        列与 to_dataframe() 一致: 全部缺失的可选字段不输出，末尾附加价格/里程区间。
+        文件名以.gz结尾时以gzip最低压缩级别输出(头部mtime固定为0，输出可复现)。
+        返回写入文件的字节数
+        """
+        optional = [field for field in _RECORD_FIELDS if field in _OPTIONAL_FIELDS]
+        optional_table = self.to_table(columns=optional)
+        fields = [field for field in _RECORD_FIELDS
+                  if field not in _OPTIONAL_FIELDS
+                  or optional_table.column(field).null_count < optional_table.num_rows]
+        schema = pa.schema(
+            [_ARROW_SCHEMA.field(field) for field in fields]
+            + [pa.field('价格区间', pa.string()), pa.field('里程区间', pa.string())]
+        )
+        
+        compress = filename.endswith('.gz')
+        with open(filename, 'wb', buffering=4 << 20) as raw:
+            with (gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1, mtime=0) if compress
+                  else contextlib.nullcontext(raw)) as f:
+                f.write(codecs.BOM_UTF8)  # 保持utf-8-sig，Excel可直接打开
+                with pacsv.CSVWriter(f, schema) as writer:
+                    for table in self._iter_tables():
+                        writer.write_table(pa.table(
+                            [table.column(field) for field in fields] + [
+                                self._range_labels(table.column('价格'), _PRICE_BINS, _PRICE_LABELS),
+                                self._range_labels(table.column('里程'), _MILEAGE_BINS, _MILEAGE_LABELS),
+                            ],
+                            schema=schema
+                        ))
+            # 写入的总字节数，调用方无需再stat文件
+            return raw.tell()
+    
+    def _range_labels(self, column, bins, labels):
+        """Arrow数值列映射为区间标签的字符串数组，null的区间也为null"""
+        values = column.to_numpy()
+        codes = np.searchsorted(bins, values, side='right')
+        return pa.array(np.asarray(labels, dtype=object)[codes], type=pa.string(), mask=np.isnan(values))
+    
+    def _iter_tables(self):
+        """依次产出每个分片及内存中数据的Arrow表
+        
+        后台线程预读下一个分片(parquet解码时释放GIL)，与当前批次的写出重叠，
+        同一时间最多持有两个分片
+        """
+        def read_part(part_file):
+            return pq.read_table(part_file, schema=_ARROW_SCHEMA)
+        
+        if self._part_files:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = executor.submit(read_part, self._part_files[0])
+                for next_file in self._part_files[1:] + [None]:
+                    table = pending.result()
+                    pending = executor.submit(read_part, next_file) if next_file else None
+                    yield table
+        if self._size:
+            yield self.to_arrow()
+    
+    def to_arrow(self):
+        """把内存中的行转换为Arrow表 (数值列中的NaN转换为null)"""
+        return pa.table(
+            {field: self._arrow_column(field) for field in _RECORD_FIELDS},
+            schema=_ARROW_SCHEMA
+        )
+    
+    def _arrow_column(self, field):
+        """内存中的一列转换为Arrow数组，分类字段经字典数组解码为字符串"""
+        if field in _CATEGORICAL_FIELDS:
+            codes = self._view(field)
+            dictionary = pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0),
+                pa.array(self._categories[_FIELD_INDEX[field]], type=pa.string())
+            )
+            return dictionary.cast(pa.string())
+        values = self._view(field) if field in _FIELD_DTYPES else self.columns[field]
+        return pa.array(values, type=_ARROW_SCHEMA.field(field).type, from_pandas=True)
+    
+    def spill(self, part_file):
+        """把内存中的行写入parquet分片并清空，返回是否写出了数据"""
+        if not self._size:
+            return False
+        pq.write_table(self.to_arrow(), part_file)
+        self._part_files.append(part_file)
+        self._spilled_rows += self._size
+        self.columns = self._new_columns()
+        self._size = 0
         return True
     
-    def close_driver(self):
-        """关闭WebDriver"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.driver = None
-                logger.info("WebDriver 已关闭")
-            except Exception as e:
-                logger.warning(f"关闭WebDriver时出错: {str(e)}")
-        
-    def get_random_delay(self, min_delay=None, max_delay=None):
-        """获取随机延迟时间"""
-        if min_delay is None or max_delay is None:
-            min_delay, max_delay = self.request_delay
-        return random.uniform(min_delay, max_delay)
-        
-    def safe_request(self, url, max_retries=3):
-        """安全的网络请求"""
-        for attempt in range(max_retries):
-            try:
-                # 随机延迟
-                delay = self.get_random_delay()
-                time.sleep(delay)
-                
-                # 更新User-Agent
-                self.session.headers['User-Agent'] = self.ua.random
-
-                # 轮换代理
-                proxies = self._get_next_proxy()
-
-                response = self.session.get(url, timeout=15, proxies=proxies)
-                response.raise_for_status()
-                
-                # 自动检测编码
-                if response.encoding == 'ISO-8859-1':
-                    response.encoding = response.apparent_encoding
-                elif not response.encoding:
-                    response.encoding = 'utf-8'
-                    
-                return response
-                
-            except Exception as e:
-                logger.warning(f"请求失败 (尝试 {attempt + 1}/{max_retries}): {url} - {str(e)}")
-                if attempt == max_retries - 1:
-                    return None
-                time.sleep(self.get_random_delay(2, 5) * (attempt + 1))
-        
-        return None
+    def to_table(self, columns=None, filter=None):
+        """扫描全部数据(分片+内存)为Arrow表，列投影和filter在扫描时下推执行"""
+        dataset = ds.dataset(self.to_arrow())
+        if self._part_files:
+            parts = ds.dataset(self._part_files, schema=_ARROW_SCHEMA, format='parquet')
+            dataset = ds.dataset([parts, dataset])
+        return dataset.to_table(columns=columns, filter=filter)
     
-    def load_proxies_from_file(self, filename='proxies.txt'):
-        """从文件加载代理列表"""
-        try:
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        proxy = line.strip()
-                        if proxy and not proxy.startswith('#'):
-                            if '://' not in proxy:
-                                proxy = f'http://{proxy}'
-                            self.proxies.append({'http': proxy, 'https': proxy})
-                logger.info(f"加载了 {len(self.proxies)} 个代理")
+    @classmethod
+    def from_parts(cls, part_files):
+        """引用已有的parquet分片构建，只从元数据读取行数"""
+        buffer = cls()
+        buffer._part_files = list(part_files)
+        buffer._spilled_rows = sum(pq.ParquetFile(f).metadata.num_rows for f in part_files)
+        return buffer
+    
+    @classmethod
+    def from_arrow(cls, table):
+        """从Arrow表构建"""
+        buffer = cls()
+        for field in _RECORD_FIELDS:
+            if field not in table.column_names:
+                buffer._set_column(field, [np.nan if field in _FIELD_DTYPES else None] * table.num_rows)
+            elif field in _FIELD_DTYPES:
+                buffer._set_column(field, table.column(field).to_numpy())
+            elif field in _CATEGORICAL_FIELDS:
+                encoded = table.column(field).combine_chunks().dictionary_encode()
+                buffer._set_categorical(field, encoded.indices.fill_null(-1).to_numpy(),
+                                        encoded.dictionary.to_pylist())
             else:
-                logger.info("代理文件不存在，使用直连")
-        except Exception as e:
-            logger.warning(f"加载代理文件失败: {e}")
+                buffer._set_column(field, table.column(field).to_pylist())
+        buffer._size = table.num_rows
+        return buffer
     
-    def _get_next_proxy(self):
-        """获取下一个代理"""
-        if not self.proxies:
-            return None
-        
-        proxy = self.proxies[self.proxy_index]
-        self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
-        return proxy
+    @classmethod
+    def from_dataframe(cls, df):
+        """从DataFrame构建，非数值列中的NaN转换为None"""
+        buffer = cls()
+        for field in _RECORD_FIELDS:
+            if field not in df.columns:
+                buffer._set_column(field, [np.nan if field in _FIELD_DTYPES else None] * len(df))
+            elif field in _FIELD_DTYPES:
+                buffer._set_column(field, df[field].to_numpy(dtype=np.float64, na_value=np.nan))
+            elif field in _CATEGORICAL_FIELDS:
+                categorical = pd.Categorical(df[field])
+                buffer._set_categorical(field, categorical.codes, list(categorical.categories))
+            else:
+                column = df[field].astype(object)
+                buffer._set_column(field, column.where(column.notna(), None).tolist())
+        buffer._size = len(df)
+        return buffer
+
+class Che168CardParser:
+    """车168列表页解析器 - 只依赖模块级常量，可在子进程中使用"""
+    
+    def parse_page(self, content, city_code, encoding=None):
+        """解析列表页原始字节，返回有效数据元组列表；页面无数据时返回空列表"""
+        # 空页面lxml无法解析，按无数据处理
+        if not content.strip():
+            return []
+        
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        tree = lxml.html.fromstring(content, parser=parser)
+        
+        # 多种选择器尝试
+        cards = []
+        for xpath in _CARD_XPATHS:
+            cards = xpath(tree)
+            if cards:
+                break
+        
+        records = []
+        for card in cards:
+            row = self._parse_che168_card_enhanced(card, city_code)
+            if row and self._is_valid_data(row):
+                records.append(row)
+        return records
     
     def _city_name_map(self, city_code):
         """城市代码转中文名"""
-        city_map = {
-            'beijing': '北京', 'bj': '北京',
-            'shanghai': '上海', 'sh': '上海',
-            'guangzhou': '广州', 'gz': '广州',
-            'shenzhen': '深圳', 'sz': '深圳',
-            'hangzhou': '杭州', 'hz': '杭州',
-            'nanjing': '南京', 'nj': '南京',
-            'wuhan': '武汉', 'wh': '武汉',
-            'chengdu': '成都', 'cd': '成都',
-            'xian': '西安', 'xa': '西安',
-            'chongqing': '重庆', 'cq': '重庆',
-            'tianjin': '天津', 'tj': '天津',
-            'qingdao': '青岛', 'qd': '青岛',
-            'dalian': '大连', 'dl': '大连',
-            'suzhou': '苏州', 'su': '苏州',
-            'dongguan': '东莞', 'dg': '东莞',
-            'foshan': '佛山', 'fs': '佛山',
-            'zhengzhou': '郑州', 'zz': '郑州',
-            'changsha': '长沙', 'cs': '长沙',
-            'jinan': '济南', 'jn': '济南',
-            'hefei': '合肥', 'hf': '合肥',
-            'shenyang': '沈阳', 'sy': '沈阳',
-            'changchun': '长春', 'cc': '长春',
-            'harbin': '哈尔滨', 'hrb': '哈尔滨',
-            'taiyuan': '太原', 'ty': '太原',
-            'taizhou': '台州', 'tz': '台州',
-            'ningbo': '宁波', 'nb': '宁波',
-            'wuxi': '无锡', 'wx': '无锡',
-            'changzhou': '常州',
-            'xuzhou': '徐州',
-            'yantai': '烟台',
-            'weifang': '潍坊',
-            'linyi': '临沂',
-            'zibo': '淄博',
-            'weihai': '威海',
-            'dongying': '东营',
-            'binzhou': '滨州',
-            'dezhou': '德州',
-            'liaocheng': '聊城',
-            'heze': '菏泽',
-            'zaozhuang': '枣庄',
-            'jining': '济宁',
-            'taian': '泰安',
-            'rizhao': '日照',
-            'laiwu': '莱芜',
-            'huaian': '淮安',
-            'yancheng': '盐城',
-            'yangzhou': '扬州',
-            'zhenjiang': '镇江',
-            'suqian': '宿迁',
-            'lianyungang': '连云港',
-            'shaoxing': '绍兴',
-            'jiaxing': '嘉兴',
-            'huzhou': '湖州',
-            'lishui': '丽水',
-            'quzhou': '衢州',
-            'zhoushan': '舟山',
-            'taizhou_zj': '台州',
-            'wenzhou': '温州',
-            'kunming': '昆明', 'km': '昆明',
-            'lanzhou': '兰州', 'lz': '兰州',
-            'urumqi': '乌鲁木齐',
-            'guiyang': '贵阳', 'gy': '贵阳',
-            'nanning': '南宁', 'nn': '南宁',
-            'haikou': '海口', 'hk': '海口',
-            'shijiazhuang': '石家庄', 'sjz': '石家庄',
-            'taiyuan': '太原',
-            'hohhot': '呼和浩特',
-            'changchun': '长春'
-        }
-        return city_map.get(city_code, city_code)
+        return _CITY_NAME_MAP.get(city_code, city_code)
     
-    def _extract_number(self, text, pattern, default=None):
-        """提取数字"""
+    def _scan_card_fields(self, text):
+        """单次扫描卡片文本，记录每条提取规则最左侧的数字匹配"""
+        fields = {}
+        for match in _NUMBER_PATTERN.finditer(text):
+            number = match.group(1)
+            start, end = match.span()
+            
+            # 标签与数字之间允许一个冒号
+            prefix = text[max(0, start - _CARD_LABEL_MAX_LEN - 1):start]
+            if prefix.endswith(('：', ':')):
+                prefix = prefix[:-1]
+            
+            for key, label, unit, is_year in _CARD_FIELD_RULES:
+                if key in fields:
+                    continue
+                if label and not prefix.endswith(label):
+                    continue
+                if unit and not text.startswith(unit, end):
+                    continue
+                if is_year:
+                    if len(number) < 4 or not number[-4:].isdigit():
+                        continue
+                    fields[key] = number[-4:]
+                else:
+                    fields[key] = number
+            
+            if len(fields) == len(_CARD_FIELD_RULES):
+                break
+        return fields
+    
+    def _extract_number(self, fields, key, default=None):
+        """从扫描结果中提取数字"""
         try:
-            match = re.search(pattern, text)
-            if match:
-                return float(match.group(1))
+            value = fields.get(key)
+            if value is not None:
+                return float(value)
             return default
         except:
             return default
     
-    def _extract_year(self, text):
+    def _extract_year(self, fields):
         """提取年份"""
-        patterns = [r'(\d{4})款', r'(\d{4})年', r'(\d{4})-']
-        for pattern in patterns:
-            year = self._extract_number(text, pattern)
+        for key in ('year_kuan', 'year_nian', 'year_dash'):
+            year = self._extract_number(fields, key)
             if year and 2000 <= year <= 2025:
                 return int(year)
         return None
     
-    def _extract_mileage(self, text):
+    def _extract_mileage(self, fields):
         """提取里程"""
         # 万公里
-        mileage = self._extract_number(text, r'([\d.]+)万公里')
+        mileage = self._extract_number(fields, 'mileage_wan')
         if mileage is not None:
             return int(mileage * 10000)
         
         # 公里
-        mileage = self._extract_number(text, r'([\d.]+)公里')
+        mileage = self._extract_number(fields, 'mileage_km')
         if mileage is not None:
             return int(mileage)
         
         return None
     
-    def _extract_displacement(self, text):
+    def _extract_displacement(self, fields):
         """提取排量"""
-        displacement = self._extract_number(text, r'([\d.]+)[LT]')
+        displacement = self._extract_number(fields, 'displacement')
         if displacement and 0.5 <= displacement <= 8.0:
             return displacement
         return None
@@ -328,20 +641,14 @@ class CarDataScraper:
     
     def _parse_car_title(self, title):
         """解析车辆标题获取品牌和车型"""
-        brands = [
-            '奥迪', '宝马', '奔驰', '大众', '丰田', '本田', '日产', '马自达', '现代', '起亚', 
-            '福特', '雪佛兰', '别克', '凯迪拉克', '沃尔沃', '捷豹', '路虎', '保时捷', '特斯拉',
-            '比亚迪', '吉利', '长城', '奇瑞', '长安', '荣威', '名爵', '传祺', '红旗', '领克',
-            '蔚来', '小鹏', '理想', '威马', '零跑', '哪吒', '极氪', '岚图', '高合', '智己',
-            '雷克萨斯', '英菲尼迪', '讴歌', '林肯', '凯迪拉克', '克莱斯勒', 'Jeep', '道奇',
-            '菲亚特', '阿尔法罗密欧', '玛莎拉蒂', '法拉利', '兰博基尼', '宾利', '劳斯莱斯',
-            '阿斯顿马丁', '迈凯伦', '布加迪', '帕加尼', '柯尼塞格', '五菱', '宝骏', '东风',
-            '一汽', '北汽', '江淮', '海马', '众泰', '力帆', '观致', '启辰', '思铭', '理念'
-        ]
-        
-        for brand in brands:
-            if brand in title:
-                return brand, title
+        if _BRAND_AUTOMATON is not None:
+            matches = [value for _, value in _BRAND_AUTOMATON.iter(title)]
+            if matches:
+                return min(matches)[1], title
+        else:
+            for brand in _BRANDS:
+                if brand in title:
+                    return brand, title
         
         # 如果没有匹配到品牌，尝试从标题开头提取
         parts = title.split()
@@ -353,7 +660,7 @@ class CarDataScraper:
     def _parse_price(self, price_text):
         """解析价格文本"""
         try:
-            price_match = re.search(r'([\d.]+)', price_text.replace(',', ''))
+            price_match = _NUMBER_PATTERN.search(price_text.replace(',', ''))
             if price_match:
                 return float(price_match.group(1))
             return None
@@ -362,7 +669,7 @@ class CarDataScraper:
     
     def _infer_fuel_type(self, brand, model):
         """根据品牌和车型推断燃料类型"""
-        if brand in ['特斯拉', '蔚来', '小鹏', '理想', '威马', '零跑', '哪吒']:
+        if brand in _EV_BRANDS:
             return '电动'
         elif 'EV' in model or '电' in model:
             return '电动'
@@ -375,105 +682,439 @@ class CarDataScraper:
     
     def _infer_car_type(self, model):
         """根据车型推断车辆类型"""
-        suv_keywords = ['SUV', 'X', 'Q', 'GL', 'GLE', 'RX', 'NX', 'CX', 'CR', 'RAV', 'XC', 'QX']
-        mpv_keywords = ['MPV', 'GL8', 'ODYSSEY', 'SIENNA', 'ALPHARD', 'ELYSION']
-        
         model_upper = model.upper()
         
-        if any(keyword in model_upper for keyword in suv_keywords):
+        if _SUV_PATTERN.search(model_upper):
             return 'SUV'
-        elif any(keyword in model_upper for keyword in mpv_keywords):
+        elif _MPV_PATTERN.search(model_upper):
             return 'MPV'
         else:
             return '轿车'
     
     def _extract_color(self, text):
         """提取车辆颜色"""
-        colors = ['白色', '黑色', '银色', '灰色', '红色', '蓝色', '金色', '棕色', '绿色', '黄色', '橙色', '紫色']
-        for color in colors:
+        for color in _COLORS:
             if color in text:
                 return color
         return None
     
-    def _extract_condition_score(self, text):
+    def _extract_condition_score(self, fields):
         """提取车况评分"""
-        score_match = re.search(r'车况[：:]?([\d.]+)分', text)
-        if score_match:
-            return float(score_match.group(1))
-        
-        # 尝试其他模式
-        score_match = re.search(r'评分[：:]?([\d.]+)', text)
-        if score_match:
-            return float(score_match.group(1))
+        for key in ('condition', 'score'):
+            if key in fields:
+                return float(fields[key])
         
         # 不生成模拟数据，返回None
         return None
     
-    def _extract_fuel_consumption(self, text):
+    def _extract_fuel_consumption(self, fields):
         """提取油耗"""
-        consumption_match = re.search(r'油耗[：:]?([\d.]+)L', text)
-        if consumption_match:
-            return float(consumption_match.group(1))
-        
-        consumption_match = re.search(r'([\d.]+)L/100km', text)
-        if consumption_match:
-            return float(consumption_match.group(1))
+        for key in ('consumption_label', 'consumption'):
+            if key in fields:
+                return float(fields[key])
         
         return None
     
-    def _extract_max_speed(self, text):
+    def _extract_max_speed(self, fields):
         """提取最高时速"""
-        speed_match = re.search(r'最高时速[：:]?([\d.]+)', text)
-        if speed_match:
-            return float(speed_match.group(1))
-        
-        speed_match = re.search(r'([\d.]+)km/h', text)
-        if speed_match:
-            return float(speed_match.group(1))
+        for key in ('max_speed_label', 'max_speed'):
+            if key in fields:
+                return float(fields[key])
         
         # 不生成模拟数据，返回None
         return None
     
-    def _extract_acceleration(self, text):
+    def _extract_acceleration(self, fields):
         """提取加速时间"""
-        acc_match = re.search(r'加速[：:]?([\d.]+)秒', text)
-        if acc_match:
-            return float(acc_match.group(1))
-        
-        acc_match = re.search(r'0-100km/h[：:]?([\d.]+)s', text)
-        if acc_match:
-            return float(acc_match.group(1))
+        for key in ('acceleration_label', 'acceleration'):
+            if key in fields:
+                return float(fields[key])
         
         # 不生成模拟数据，返回None
         return None
     
-    def _get_price_range(self, price):
-        """获取价格区间"""
-        if price < 10:
-            return '10万以下'
-        elif price < 20:
-            return '10-20万'
-        elif price < 30:
-            return '20-30万'
-        elif price < 50:
-            return '30-50万'
-        elif price < 100:
-            return '50-100万'
-        else:
-            return '100万以上'
-    
-    def _get_mileage_range(self, mileage):
-        """获取里程区间"""
-        if mileage < 10000:
-            return '1万公里以下'
-        elif mileage < 30000:
-            return '1-3万公里'
-        elif mileage < 50000:
-            return '3-5万公里'
-        elif mileage < 100000:
-            return '5-10万公里'
-        else:
-            return '10万公里以上'
+    def _element_text(self, element):
+        """提取元素的全部文本，每段去除首尾空白后拼接"""
+        return ''.join(text.strip() for text in _TEXT_XPATH(element))
+    
+    def _parse_che168_card_enhanced(self, card, city_code):
+        """增强版车168卡片解析"""
+        try:
+            # 多种方式提取标题
+            title = ''
+            for xpath in _TITLE_XPATHS:
+                elems = xpath(card)
+                if elems:
+                    title = elems[0].get('carname') or self._element_text(elems[0])
+                    if title:
+                        break
+            
+            if not title:
+                return None
+            
+            full_text = self._element_text(card)
+            
+            # 单次扫描提取所有数字字段
+            fields = self._scan_card_fields(full_text)
+            
+            # 提取价格
+            price = float(fields['price']) if 'price' in fields else None
+            
+            if not price or price <= 0:
+                return None
+            
+            # 解析基本信息
+            brand, model = self._parse_car_title(title)
+            year = self._extract_year(fields)
+            mileage = self._extract_mileage(fields)
+            displacement = self._extract_displacement(fields)
+            transmission = self._extract_transmission(full_text)
+            
+            # 基本验证
+            if not year or not mileage:
+                return None
+            
+            # 提取更多字段
+            color = self._extract_color(full_text)
+            condition_score = self._extract_condition_score(fields)
+            fuel_consumption = self._extract_fuel_consumption(fields)
+            max_speed = self._extract_max_speed(fields)
+            acceleration = self._extract_acceleration(fields)
+            
+            # 按 _RECORD_FIELDS 的顺序构建定长元组，缺失的可选字段为None
+            return (
+                brand,
+                model,
+                price,
+                year,
+                mileage,
+                self._infer_fuel_type(brand, model),
+                transmission or '自动',
+                self._infer_car_type(model),
+                '车168',
+                self._city_name_map(city_code),
+                displacement,
+                color or None,
+                condition_score,
+                fuel_consumption,
+                max_speed,
+                acceleration,
+                2024 - year if year else None,
+            )
+            
+        except Exception as e:
+            logger.debug(f"解析车168卡片失败: {e}")
+            return None
+    
+    
+    
+    
+    
+    def _is_valid_data(self, row):
+        """验证数据有效性 (row 为按 _RECORD_FIELDS 排列的元组)"""
+        required_fields = ['品牌', '车型', '价格', '年份', '里程']
+        
+        for field in required_fields:
+            if not row[_FIELD_INDEX[field]]:
+                return False
+        
+        # 价格范围检查
+        if not (0.1 <= row[_FIELD_INDEX['价格']] <= 2000):
+            return False
+        
+        # 年份范围检查
+        if not (2000 <= row[_FIELD_INDEX['年份']] <= 2025):
+            return False
+        
+        # 里程范围检查
+        if not (0 <= row[_FIELD_INDEX['里程']] <= 1000000):
+            return False
+        
+        return True
+
+_PAGE_PARSER = Che168CardParser()
+
+def _parse_page_bytes(content, city_code, encoding=None):
+    """进程池任务: 解析列表页字节，结果为可直接pickle的元组列表"""
+    return _PAGE_PARSER.parse_page(content, city_code, encoding)
+
+class CarDataScraper(Che168CardParser):
+    """汽车数据爬虫类 - 车168专版"""
+    
+    def __init__(self):
+        self.ua = UserAgent()
+        # 预生成User-Agent池，避免每次请求都调用fake_useragent
+        self._ua_pool = [self.ua.random for _ in range(64)]
+        self.session = requests.Session()
+        self.data = CarRecordBuffer()
+        self.driver = None
+        self.scraped_urls = self._new_url_filter()  # 防重复爬取
+        self._seen_rows = set()  # 已收录记录的去重键
+        
+        # 动态延迟配置
+        self.request_delay = (0.5, 2.0)
+        
+        # 并发配置: 多线程同时抓取页面，全局限速代替每个请求串行sleep
+        self.max_workers = 16
+        self.request_interval = (0.05, 0.2)  # 全局相邻请求的最小间隔(秒)
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        self._proxy_lock = threading.Lock()
+        
+        # 解析进程池: 爬取期间创建，未创建时在抓取线程内直接解析
+        self.parse_workers = os.cpu_count() or 1
+        self._parser_pool = None
+        
+        # 连接池: 复用到che168的keep-alive连接，重试交给urllib3处理
+        self.retry_statuses = (429, 500, 502, 503, 504)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=list(self.retry_statuses),
+            allowed_methods=['GET']
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # 设置通用请求头
+        self.headers = {
+            'User-Agent': random.choice(self._ua_pool),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Cache-Control': 'no-cache',
+            'Pragma': 'no-cache',
+        }
+        self.session.headers.update(self.headers)
+        
+        # 代理池
+        self.proxies = []
+        self.proxy_index = 0
+        self.load_proxies_from_file()
+        
+        # HTTP/2客户端: 直连时所有线程的请求在少量TLS连接上多路复用；
+        # httpx不支持按请求切换代理，加载了代理池时仍使用requests会话
+        self.client = None
+        if HTTPX_AVAILABLE and not self.proxies:
+            self.client = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=15,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,  # 只重试连接错误，状态码重试见 _http2_get
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+                )
+            )
+        
+        # 检查点: 数据按批写入目录下的parquet分片(写出后不再占用内存)，已爬取URL追加写入jsonl
+        self.checkpoint_dir = 'scraper_checkpoint'
+        self.checkpoint_urls_file = os.path.join(self.checkpoint_dir, 'scraped_urls.jsonl')
+        self.checkpoint_batch = 500  # 内存中累积多少条数据后写出一个分片
+        self._checkpoint_parts = 0
+        self._unsaved_urls = []  # 尚未写入检查点的URL
+        
+    def _new_url_filter(self):
+        """创建已爬取URL集合
+        
+        安装了pybloom-live时使用布隆过滤器限制内存占用，误判只会跳过个别页面；
+        完整的URL列表保存在检查点的jsonl文件中
+        """
+        if BLOOM_AVAILABLE:
+            return ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+        return set()
+    
+    def _checkpoint_part_files(self):
+        """检查点中已有的parquet分片，按写入顺序排列"""
+        return sorted(glob.glob(os.path.join(self.checkpoint_dir, 'part-*.parquet')))
+    
+    def load_checkpoint(self):
+        """加载检查点"""
+        try:
+            part_files = self._checkpoint_part_files()
+            if part_files:
+                self.data = CarRecordBuffer.from_parts(part_files)
+                self._checkpoint_parts = len(part_files)
+                
+                keys = self.data.to_table(columns=list(_DEDUP_FIELDS))
+                self._seen_rows = set(zip(*(keys.column(field).to_pylist() for field in _DEDUP_FIELDS)))
+                
+                if os.path.exists(self.checkpoint_urls_file):
+                    self.scraped_urls = self._new_url_filter()
+                    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+                    with open(self.checkpoint_urls_file, 'rb') as f:
+                        for line in f:
+                            if line.strip():
+                                self.scraped_urls.add(loads(line))
+                
+                logger.info(f"从检查点恢复: {len(self.data)} 条数据, {len(self.scraped_urls)} 个已爬取URL")
+                return True
+        except Exception as e:
+            logger.warning(f"加载检查点失败: {e}")
+        return False
+    
+    def save_checkpoint(self):
+        """保存检查点(只追加上次保存之后的新数据和URL)"""
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            
+            part_file = os.path.join(self.checkpoint_dir, f'part-{self._checkpoint_parts:05d}.parquet')
+            if self.data.spill(part_file):
+                self._checkpoint_parts += 1
+            
+            if self._unsaved_urls:
+                if ORJSON_AVAILABLE:
+                    lines = b''.join(orjson.dumps(url) + b'\n' for url in self._unsaved_urls)
+                else:
+                    lines = ''.join(json.dumps(url, ensure_ascii=False) + '\n'
+                                    for url in self._unsaved_urls).encode('utf-8')
+                with open(self.checkpoint_urls_file, 'ab') as f:
+                    f.write(lines)
+                self._unsaved_urls = []
+            
+            logger.info(f"检查点已保存: {len(self.data)} 条数据")
+        except Exception as e:
+            logger.warning(f"保存检查点失败: {e}")
+    
+    def setup_driver(self):
+        """设置Selenium WebDriver"""
+        if not SELENIUM_AVAILABLE:
+            logger.warning("未安装selenium，无法使用WebDriver")
+            return False
+        if self.driver is None:
+            try:
+                options = Options()
+                options.add_argument('--headless=new')
+                options.add_argument('--no-sandbox')
+                options.add_argument('--disable-dev-shm-usage')
+                options.add_argument('--disable-gpu')
+                options.add_argument('--disable-blink-features=AutomationControlled')
+                options.add_argument('--window-size=1920,1080')
+                options.add_argument('--disable-images')
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                options.add_argument('--disable-extensions')
+                options.add_argument('--disable-popup-blocking')
+                options.add_argument(f'--user-agent={random.choice(self._ua_pool)}')
+                options.add_experimental_option('useAutomationExtension', False)
+                options.add_experimental_option('excludeSwitches', ['enable-automation'])
+                options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2,
+                    'profile.default_content_setting_values.notifications': 2,
+                })
+                # DOM就绪即返回，不等待图片等子资源加载完成
+                options.page_load_strategy = 'eager'
+
+                self.driver = webdriver.Chrome(options=options)
+                self.driver.set_page_load_timeout(30)
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                    "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+                })
+                logger.info("WebDriver 初始化成功")
+                return True
+            except Exception as e:
+                logger.error(f"WebDriver 初始化失败: {str(e)}")
+                return False
+        return True
+    
+    def close_driver(self):
+        """关闭WebDriver"""
+        if self.driver:
+            try:
+                self.driver.quit()
+                self.driver = None
+                logger.info("WebDriver 已关闭")
+            except Exception as e:
+                logger.warning(f"关闭WebDriver时出错: {str(e)}")
+        
+    def get_random_delay(self, min_delay=None, max_delay=None):
+        """获取随机延迟时间"""
+        if min_delay is None or max_delay is None:
+            min_delay, max_delay = self.request_delay
+        return random.uniform(min_delay, max_delay)
+        
+    def _wait_for_rate_limit(self):
+        """全局限速: 所有线程共享一个请求时间表，相邻请求至少间隔 request_interval"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + self.get_random_delay(*self.request_interval)
+        if start > now:
+            time.sleep(start - now)
+        
+    def _pause_requests(self, seconds):
+        """在全局请求时间表中插入一段空闲，由之后的请求等待，调用线程不阻塞"""
+        with self._rate_lock:
+            self._next_request_time = max(time.monotonic(), self._next_request_time) + seconds
+        
+    def safe_request(self, url):
+        """安全的网络请求(线程安全，失败重试由session的Retry策略完成)"""
+        try:
+            # 全局限速
+            self._wait_for_rate_limit()
+            
+            # 更新User-Agent (按请求传入，避免多线程修改共享的session头)
+            headers = {'User-Agent': random.choice(self._ua_pool)}
+
+            if self.client is not None:
+                return self._http2_get(url, headers)
+
+            # 轮换代理
+            proxies = self._get_next_proxy()
+
+            response = self.session.get(url, timeout=15, headers=headers, proxies=proxies)
+            response.raise_for_status()
+            
+            # 自动检测编码
+            if response.encoding == 'ISO-8859-1':
+                response.encoding = response.apparent_encoding
+            elif not response.encoding:
+                response.encoding = 'utf-8'
+                
+            return response
+            
+        except Exception as e:
+            logger.warning(f"请求失败: {url} - {str(e)}")
+            return None
+    
+    def _http2_get(self, url, headers, retries=3, backoff_factor=0.5):
+        """通过HTTP/2客户端请求，按与requests会话相同的状态码和退避策略重试"""
+        for attempt in range(retries + 1):
+            response = self.client.get(url, headers=headers)
+            if response.status_code not in self.retry_statuses or attempt == retries:
+                break
+            time.sleep(backoff_factor * (2 ** attempt))
+        response.raise_for_status()
+        return response
+    
+    def load_proxies_from_file(self, filename='proxies.txt'):
+        """从文件加载代理列表"""
+        try:
+            if os.path.exists(filename):
+                with open(filename, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        proxy = line.strip()
+                        if proxy and not proxy.startswith('#'):
+                            if '://' not in proxy:
+                                proxy = f'http://{proxy}'
+                            self.proxies.append({'http': proxy, 'https': proxy})
+                logger.info(f"加载了 {len(self.proxies)} 个代理")
+            else:
+                logger.info("代理文件不存在，使用直连")
+        except Exception as e:
+            logger.warning(f"加载代理文件失败: {e}")
+    
+    def _get_next_proxy(self):
+        """获取下一个代理"""
+        if not self.proxies:
+            return None
+        
+        with self._proxy_lock:
+            proxy = self.proxies[self.proxy_index]
+            self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
+        return proxy
     
     def scrape_che168_enhanced(self, cities=None, max_pages_per_city=50, target_count=20000):
         """增强版车168爬虫 - 多城市全覆盖"""
@@ -494,7 +1135,13 @@ class CarDataScraper:
         
         total_scraped = 0
         
-        with tqdm(total=target_count, desc="爬取进度") as pbar:
+        # 解析进程在首次提交时才创建，此时抓取线程可能正持有urllib3/logging等锁，
+        # fork出的子进程会继承这些已锁住的锁而死锁，因此使用spawn启动
+        with tqdm(total=target_count, desc="爬取进度") as pbar, \
+                ProcessPoolExecutor(max_workers=self.parse_workers,
+                                    mp_context=multiprocessing.get_context('spawn')) as parser_pool, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            self._parser_pool = parser_pool
             # 动态调整每个城市的目标数量
             per_city_min = 200  # 每个城市最少爬取200条
             per_city_max = 1500  # 每个城市最多爬取1500条
@@ -527,74 +1174,57 @@ class CarDataScraper:
                         break
                     if city_scraped >= adjusted_target and city_scraped >= per_city_min:
                         break
-                        
-                    for page in range(1, max_pages_per_city + 1):
+                    
+                    # 滑动窗口: 始终保持 max_workers 个页面在途，按页码顺序处理结果
+                    page_urls = self._iter_page_urls(city, category, max_pages_per_city)
+                    in_flight = deque(
+                        (page, url, executor.submit(self._fetch_che168_page, url, city))
+                        for page, url in islice(page_urls, self.max_workers)
+                    )
+                    
+                    while in_flight:
                         if total_scraped >= target_count:
                             break
                         if city_scraped >= adjusted_target and city_scraped >= per_city_min:
                             break
-                            
-                        try:
-                            url = f"https://www.che168.com/{city}/list/{category}?page={page}"
-                            
-                            if url in self.scraped_urls:
-                                continue
-                                
-                            response = self.safe_request(url)
-                            if not response:
-                                continue
-                            
-                            soup = BeautifulSoup(response.text, 'lxml')
-                            
-                            # 多种选择器尝试
-                            selectors = [
-                                "li.cards-li",
-                                ".list-item",
-                                ".car-item",
-                                ".item-info"
-                            ]
-                            
-                            cards = []
-                            for selector in selectors:
-                                cards = soup.select(selector)
-                                if cards:
-                                    break
-                            
-                            if not cards:
-                                logger.debug(f"页面无数据: {url}")
-                                break
-                            
-                            new_records = 0
-                            for card in cards:
-                                if total_scraped >= target_count:
-                                    break
-                                    
-                                car_data = self._parse_che168_card_enhanced(card, city)
-                                if car_data and self._is_valid_data(car_data):
-                                    self.data.append(car_data)
-                                    new_records += 1
-                                    total_scraped += 1
-                                    city_scraped += 1
-                                    pbar.update(1)
-                            
-                            self.scraped_urls.add(url)
-                            
-                            if new_records > 0:
-                                logger.info(f"✅ {self._city_name_map(city)} {category} 第{page}页: +{new_records}条")
-                            
-                            # 定期保存检查点
-                            if len(self.data) % 1000 == 0:
-                                self.save_checkpoint()
-                            
-                            # 如果连续几页没数据，跳出分类
-                            if new_records == 0:
-                                break
-                                
-                            time.sleep(self.get_random_delay(*self.page_delay))
-                            
-                        except Exception as e:
-                            logger.error(f"爬取页面出错 {url}: {str(e)}")
+                        
+                        page, url, future = in_flight.popleft()
+                        records = future.result()
+                        
+                        # 补充下一个页面，保持窗口满载
+                        for next_page, next_url in islice(page_urls, 1):
+                            in_flight.append((next_page, next_url,
+                                              executor.submit(self._fetch_che168_page, next_url, city)))
+                        
+                        # 请求失败，跳过该页
+                        if records is None:
                             continue
+                        
+                        # 页面无数据，后续页面也不会有，跳出分类
+                        if not records:
+                            break
+                        
+                        # 同一车源可能因列表更新出现在相邻页面，只收录未出现过的记录
+                        records = self._unseen_records(records, target_count - total_scraped)
+                        new_records = len(records)
+                        self.data.extend(records)
+                        total_scraped += new_records
+                        city_scraped += new_records
+                        pbar.update(new_records)
+                        
+                        self.scraped_urls.add(url)
+                        self._unsaved_urls.append(url)
+                        
+                        if new_records > 0:
+                            logger.info(f"✅ {self._city_name_map(city)} {category} 第{page}页: +{new_records}条")
+                        
+                        # 定期保存检查点
+                        if self.data.pending_rows >= self.checkpoint_batch:
+                            self.save_checkpoint()
+                    
+                    # 分类结束后取消尚未开始的请求
+                    for _, _, future in in_flight:
+                        future.cancel()
                 
                 logger.info(f"🏁 {self._city_name_map(city)} 完成，获得 {city_scraped} 条数据")
                 
@@ -604,133 +1234,63 @@ class CarDataScraper:
                 elif city_scraped >= adjusted_target:
                     logger.info(f"✅ {self._city_name_map(city)} 达到目标: {city_scraped} >= {adjusted_target}")
                 
-                # 城市间休息
+                # 城市间休息: 写入全局请求时间表，不阻塞当前线程
                 if city_scraped > 0:
-                    time.sleep(self.get_random_delay(2, 5))
+                    self._pause_requests(self.get_random_delay(2, 5))
                 else:
-                    time.sleep(self.get_random_delay(1, 2))  # 没数据的城市休息时间短一些
+                    self._pause_requests(self.get_random_delay(1, 2))  # 没数据的城市休息时间短一些
+            
+            self._parser_pool = None
         
         logger.info(f"🎉 车168爬取完成，总共获得 {total_scraped} 条数据")
         return total_scraped
     
-    def _parse_che168_card_enhanced(self, card, city_code):
-        """增强版车168卡片解析"""
+    def _unseen_records(self, records, limit):
+        """按去重键过滤已收录的记录，返回最多limit条新记录，只登记实际收录的记录"""
+        fresh = []
+        for row in records:
+            if len(fresh) >= limit:
+                break
+            key = _DEDUP_KEY(row)
+            if key not in self._seen_rows:
+                self._seen_rows.add(key)
+                fresh.append(row)
+        return fresh
+    
+    def _iter_page_urls(self, city, category, max_pages):
+        """按页码顺序生成尚未爬取的列表页 (页码, URL)"""
+        for page in range(1, max_pages + 1):
+            url = f"https://www.che168.com/{city}/list/{category}?page={page}"
+            if url not in self.scraped_urls:
+                yield page, url
+    
+    def _fetch_che168_page(self, url, city_code):
+        """抓取并解析单个列表页(在线程池中执行)
+        
+        返回有效数据列表；页面无数据时返回空列表，请求失败时返回None
+        """
         try:
-            # 多种方式提取标题
-            title = ''
-            title_selectors = ['[carname]', 'h4', '.card-name', '.car-name', '.title']
-            for selector in title_selectors:
-                elem = card.select_one(selector)
-                if elem:
-                    title = elem.get('carname') or elem.get_text(strip=True)
-                    if title:
-                        break
-            
-            if not title:
+            response = self.safe_request(url)
+            if not response:
                 return None
             
-            full_text = card.get_text(strip=True)
-            
-            # 提取价格
-            price = None
-            price_patterns = [
-                r'([\d.]+)万',
-                r'¥([\d.]+)万',
-                r'售价[：:]?([\d.]+)万'
-            ]
-            
-            for pattern in price_patterns:
-                match = re.search(pattern, full_text)
-                if match:
-                    price = float(match.group(1))
-                    break
-            
-            if not price or price <= 0:
-                return None
-            
-            # 解析基本信息
-            brand, model = self._parse_car_title(title)
-            year = self._extract_year(full_text)
-            mileage = self._extract_mileage(full_text)
-            displacement = self._extract_displacement(full_text)
-            transmission = self._extract_transmission(full_text)
-            
-            # 基本验证
-            if not year or not mileage:
-                return None
-            
-            # 提取更多字段
-            color = self._extract_color(full_text)
-            condition_score = self._extract_condition_score(full_text)
-            fuel_consumption = self._extract_fuel_consumption(full_text)
-            max_speed = self._extract_max_speed(full_text)
-            acceleration = self._extract_acceleration(full_text)
-            
-            # 构建数据字典，只包含有值的字段
-            data = {
-                '品牌': brand,
-                '车型': model,
-                '价格': price,
-                '年份': year,
-                '里程': mileage,
-                '燃料类型': self._infer_fuel_type(brand, model),
-                '变速器': transmission or '自动',
-                '车辆类型': self._infer_car_type(model),
-                '数据来源': '车168',
-                '所在城市': self._city_name_map(city_code),
-            }
-            
-            # 只添加有值的可选字段
-            if displacement is not None:
-                data['排量'] = displacement
-            if color:
-                data['颜色'] = color
-            if condition_score is not None:
-                data['车况评分'] = condition_score
-            if fuel_consumption is not None:
-                data['油耗'] = fuel_consumption
-            if max_speed is not None:
-                data['最高时速'] = max_speed
-            if acceleration is not None:
-                data['加速时间'] = acceleration
-            if year:
-                data['车龄'] = 2024 - year
-            
-            data['价格区间'] = self._get_price_range(price)
-            data['里程区间'] = self._get_mileage_range(mileage)
+            # 解析是CPU密集型任务，交给进程池绕开GIL；当前线程只等待结果
+            # httpx响应只在响应头声明字符集时才指定编码，否则由lxml按页面meta识别
+            encoding = getattr(response, 'charset_encoding', response.encoding)
+            args = (response.content, city_code, encoding)
+            if self._parser_pool is not None:
+                records = self._parser_pool.submit(_parse_page_bytes, *args).result()
+            else:
+                records = _parse_page_bytes(*args)
             
-            return data
+            if not records:
+                logger.debug(f"页面无数据: {url}")
+            return records
             
         except Exception as e:
-            logger.debug(f"解析车168卡片失败: {e}")
+            logger.error(f"爬取页面出错 {url}: {str(e)}")
             return None
     
-    
-    
-    
-    
-    def _is_valid_data(self, data):
-        """验证数据有效性"""
-        required_fields = ['品牌', '车型', '价格', '年份', '里程']
-        
-        for field in required_fields:
-            if not data.get(field):
-                return False
-        
-        # 价格范围检查
-        if not (0.1 <= data['价格'] <= 2000):
-            return False
-        
-        # 年份范围检查
-        if not (2000 <= data['年份'] <= 2025):
-            return False
-        
-        # 里程范围检查
-        if not (0 <= data['里程'] <= 1000000):
-            return False
-        
-        return True
-    
     def scrape_all_sources(self, target_count=20000):
         """爬取车168数据源"""
         logger.info(f"开始爬取车168数据，目标: {target_count} 条数据")
@@ -772,35 +1332,29 @@ class CarDataScraper:
             logger.warning("没有数据需要处理")
             return
         
-        df = pd.DataFrame(self.data)
-        initial_count = len(df)
+        initial_count = len(self.data)
         
-        # 1. 去重
-        df = df.drop_duplicates(subset=['品牌', '车型', '年份', '里程', '价格'], keep='first')
-        dedup_count = initial_count - len(df)
-        logger.info(f"去重移除: {dedup_count} 条")
+        # 1. 移除异常值: 条件在扫描parquet分片时下推执行，不合格的行不会进入pandas
+        #    (去重键包含全部过滤字段，重复行的过滤结果相同，先过滤不影响去重结果)
+        table = self.data.to_table(filter=_VALID_ROW_FILTER)
+        df = CarRecordBuffer.from_arrow(table).to_dataframe()
+        logger.info(f"异常值移除: {initial_count - len(df)} 条")
         
-        # 2. 数据类型转换
-        numeric_columns = ['价格', '年份', '里程', '排量']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # 2. 去重: duplicated()内部按哈希分组，但会比较取值确认相等，不会误删哈希相同的不同车源
+        duplicated = df.duplicated(subset=list(_DEDUP_FIELDS), keep='first').to_numpy()
+        logger.info(f"去重移除: {int(duplicated.sum())} 条")
+        df = df.loc[~duplicated]
         
-        # 3. 移除异常值
-        df = df.dropna(subset=['品牌', '车型', '价格', '年份', '里程'])
-        df = df[(df['价格'] >= 0.1) & (df['价格'] <= 2000)]
-        df = df[(df['年份'] >= 2000) & (df['年份'] <= 2025)]
-        df = df[(df['里程'] >= 0) & (df['里程'] <= 1000000)]
-        
-        # 4. 填充缺失值
+        # 3. 填充缺失值
         if '排量' in df.columns:
-            df['排量'].fillna(0.0, inplace=True)
+            df['排量'] = df['排量'].fillna(0.0)
         
-        # 5. 数据标准化
+        # 4. 数据标准化
         df['价格'] = df['价格'].round(1)
-        df['排量'] = df['排量'].round(1)
+        if '排量' in df.columns:
+            df['排量'] = df['排量'].round(1)
         
-        self.data = df.to_dict('records')
+        self.data = CarRecordBuffer.from_dataframe(df)
         final_count = len(self.data)
         
         logger.info(f"数据预处理完成: {initial_count} → {final_count} 条")
@@ -813,7 +1367,7 @@ class CarDataScraper:
         if not self.data:
             return
         
-        df = pd.DataFrame(self.data)
+        df = self.data.to_dataframe()
         
         logger.info("=== 数据统计信息 ===")
         logger.info(f"总数据量: {len(df)} 条")
@@ -845,24 +1399,21 @@ class CarDataScraper:
             for city, count in city_counts.items():
                 logger.info(f"  {city}: {count} 条")
     
-    def save_data(self, filename=None):
-        """保存数据到CSV"""
+    def save_data(self, filename=None, compress=False):
+        """保存数据到CSV，compress=True 时默认文件名为 .csv.gz (gzip压缩级别1)"""
         if not self.data:
             logger.warning("没有数据需要保存")
             return False
         
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"car_data_{timestamp}.csv"
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+            filename = f"car_data_{timestamp}.csv.gz" if compress else f"car_data_{timestamp}.csv"
         
         try:
-            df = pd.DataFrame(self.data)
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
-            
-            file_size = os.path.getsize(filename) / 1024 / 1024
+            file_size = self.data.write_csv(filename) / 1024 / 1024
             logger.info(f"数据已保存: {filename}")
             logger.info(f"文件大小: {file_size:.2f} MB")
-            logger.info(f"数据条数: {len(df)} 条")
+            logger.info(f"数据条数: {len(self.data)} 条")
             
             return True
             
@@ -922,6 +1473,8 @@ def main():
     
     finally:
         scraper.close_driver()
+        if scraper.client is not None:
+            scraper.client.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
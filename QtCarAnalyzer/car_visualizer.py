@@ -7,6 +7,8 @@
 
 import sys
 import os
+import threading
+import importlib.util
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -15,30 +17,47 @@ matplotlib.use('Agg')  # 使用非交互式后端
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 from matplotlib.figure import Figure
-import seaborn as sns
-import tempfile
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-# 机器学习相关库
-try:
-    from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-    from sklearn.model_selection import train_test_split
-    from sklearn.metrics import mean_absolute_error, r2_score, classification_report
-    from sklearn.preprocessing import LabelEncoder, StandardScaler
-    from sklearn.cluster import KMeans
-    ML_AVAILABLE = True
+# 机器学习相关库: 启动时只检查是否安装，
+# scikit-learn在第一次建模时才由CarPredictionModel的各方法导入
+ML_AVAILABLE = importlib.util.find_spec('sklearn') is not None
+if ML_AVAILABLE:
     print("✅ 机器学习模块加载成功")
-except ImportError:
-    ML_AVAILABLE = False
+else:
     print("⚠️ 机器学习模块未安装，请安装scikit-learn: pip install scikit-learn")
 
+# 模型缓存 (可选，joblib随scikit-learn一同安装)
+try:
+    from joblib import Memory
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+# calamine Excel读取引擎 (可选)
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# numba加速 (可选)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QComboBox, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QComboBox, QTableView,
     QSplitter, QFrame, QFileDialog, QMessageBox, QTextEdit,
-    QGroupBox, QProgressBar, QTabWidget, QScrollArea
+    QGroupBox, QProgressBar, QTabWidget
+)
+from PySide6.QtCore import (
+    Qt, QEvent, QTimer, QThread, Signal, QAbstractTableModel, QModelIndex, QStandardPaths
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
-from PySide6.QtGui import QFont, QPixmap, QColor
+from PySide6.QtGui import QPixmap, QColor, QImage
 
 # 设置中文字体
 def setup_chinese_font():
@@ -88,135 +107,387 @@ def setup_chinese_font():
         plt.rcParams['font.family'] = 'sans-serif'
         return 'Microsoft YaHei'
 
+# 绘图样式: 由 seaborn 0.13 的 axes_style("whitegrid") 和 color_palette("husl") 生成，
+# 直接写入rcParams，不必为此导入seaborn。
+# 字体相关参数不在其中，由之后的setup_chinese_font()设置；image.cmap 是seaborn自己注册的
+# "rocket"色图，未安装seaborn时不可用，各图表也没有使用默认色图，因此保持matplotlib默认值
+PLOT_STYLE = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.prop_cycle': matplotlib.cycler(color=[
+        (0.9677975592919913, 0.44127456009157356, 0.5358103155058701),
+        (0.7350228985632719, 0.5952719904750953, 0.1944419133847522),
+        (0.3126890019504329, 0.6928754610296064, 0.1923704830330379),
+        (0.21044753832183283, 0.6773105080456748, 0.6433941168468681),
+        (0.23299120924703914, 0.639586552066035, 0.9260706093977744),
+        (0.9082572436765556, 0.40195790729656516, 0.9576909250290225),
+    ]),
+    'axes.spines.bottom': True,
+    'axes.spines.left': True,
+    'axes.spines.right': True,
+    'axes.spines.top': True,
+    'figure.facecolor': 'white',
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'text.color': '.15',
+    'xtick.bottom': False,
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.top': False,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.left': False,
+    'ytick.right': False,
+}
+plt.rcParams.update(PLOT_STYLE)
 setup_chinese_font()
-sns.set_style("whitegrid")
-sns.set_palette("husl")
+# 图表文字共用的中文字体属性，绘图时直接传给各文本对象
+CHINESE_FP = fm.FontProperties(family=plt.rcParams['font.sans-serif'])
 
-class ChartCanvas(QWidget):
-    """图表画布组件"""
+def _residual_stats_kernel(y_true, y_pred):
+    """单次遍历计算残差指标 (误差标准差用Welford算法，与pandas一致取ddof=1)
     
-    def __init__(self, parent=None):
+    真实值为0的样本没有百分比误差，不计入MAPE
+    """
+    n = y_true.shape[0]
+    sum_abs = 0.0
+    sum_sq = 0.0
+    sum_ape = 0.0
+    n_ape = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        error = y_pred[i] - y_true[i]
+        sum_abs += abs(error)
+        sum_sq += error * error
+        if y_true[i] != 0:
+            sum_ape += abs(error / y_true[i])
+            n_ape += 1
+        delta = error - mean
+        mean += delta / (i + 1)
+        m2 += delta * (error - mean)
+    std = (m2 / (n - 1)) ** 0.5 if n > 1 else np.nan
+    mape = sum_ape / n_ape * 100 if n_ape > 0 else np.nan
+    return sum_abs / n, (sum_sq / n) ** 0.5, mape, mean, std
+
+if NUMBA_AVAILABLE:
+    _residual_stats_kernel = njit(cache=True)(_residual_stats_kernel)
+
+def residual_stats(y_true, y_pred):
+    """计算预测残差指标，返回 (MAE, RMSE, MAPE%, 误差均值, 误差标准差)"""
+    y_true = np.ascontiguousarray(y_true, dtype=np.float64)
+    y_pred = np.ascontiguousarray(y_pred, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _residual_stats_kernel(y_true, y_pred)
+    errors = y_pred - y_true
+    abs_errors = np.abs(errors)
+    # 与编译版本一致，真实值为0的样本不计入MAPE
+    nonzero = y_true != 0
+    mape = np.mean(abs_errors[nonzero] / np.abs(y_true[nonzero])) * 100 if nonzero.any() else np.nan
+    return (abs_errors.mean(), np.sqrt(np.mean(errors ** 2)), mape,
+            errors.mean(), errors.std(ddof=1))
+
+def _fit_model(model_class, params, X, y):
+    """创建并训练模型"""
+    return model_class(**params).fit(X, y)
+
+def model_cache_dir():
+    """训练模型磁盘缓存目录，未开启缓存时返回None
+    
+    缓存默认关闭，通过环境变量 QTCAR_MODEL_CACHE 开启: 设为1时使用系统缓存目录
+    (如 ~/.cache/QtCarAnalyzer/models)，设为其他值时作为缓存目录使用
+    """
+    setting = os.environ.get('QTCAR_MODEL_CACHE', '').strip()
+    if setting in ('', '0'):
+        return None
+    if setting == '1':
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+        return os.path.join(cache_root, 'QtCarAnalyzer', 'models')
+    return os.path.expanduser(setting)
+
+MODEL_CACHE_DIR = model_cache_dir() if JOBLIB_AVAILABLE else None
+# 缓存总大小上限，每次建模结束后删除最久未使用的模型
+MODEL_CACHE_BYTES = 500 * 1024 ** 2
+if MODEL_CACHE_DIR:
+    _model_memory = Memory(MODEL_CACHE_DIR, verbose=0)
+    # 按(模型类型, 参数, 训练数据)缓存，同一份数据再次训练直接加载已训练的模型
+    fit_model = _model_memory.cache(_fit_model)
+else:
+    _model_memory = None
+    fit_model = _fit_model
+
+def trim_model_cache():
+    """模型缓存超过大小上限时删除最久未使用的模型"""
+    if _model_memory is not None:
+        _model_memory.reduce_size(bytes_limit=MODEL_CACHE_BYTES)
+
+# 散点数超过该值时用Line2D标记代替scatter绘制
+SCATTER_MARKER_THRESHOLD = 5000
+
+def pie_slices(counts, min_share=0.03, max_slices=6):
+    """把计数合并为饼图扇区: 占比低于min_share的类别合并为"其他"，最多max_slices个扇区
+    
+    counts为value_counts()的结果(已按数量降序)，主要类别是其前缀，只需一次切分
+    """
+    values = counts.to_numpy()
+    total = values.sum()
+    n_main = int(np.count_nonzero(values >= total * min_share))
+    if n_main + (n_main < len(values)) > max_slices:
+        n_main = max_slices - 1
+    slices = counts.iloc[:n_main]
+    other_count = total - slices.sum()
+    if other_count > 0:
+        # 一次拼接，不在切片上逐项赋值
+        slices = pd.concat([slices, pd.Series([other_count], index=['其他'])])
+    return slices
+
+def box_stats(label, values, whis=1.5):
+    """计算单组箱线图统计量，结果可直接交给 ax.bxp() 绘制
+    
+    与 ax.boxplot() 的默认算法一致: 须线延伸到 whis*IQR 范围内最远的数据点，其余为离群点
+    """
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - whis * iqr) & (values <= q3 + whis * iqr)]
+    whislo, whishi = (inside.min(), inside.max()) if inside.size else (q1, q3)
+    return dict(label=label, med=med, q1=q1, q3=q3, whislo=whislo, whishi=whishi,
+                fliers=values[(values < whislo) | (values > whishi)])
+
+def numeric_summary(values):
+    """数值列的 (均值, 中位数, 最小值, 最大值)，忽略缺失值，全部缺失时均为NaN"""
+    values = np.asarray(values, dtype=np.float64)  # 与pandas一致，均值按float64累加
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return (np.nan,) * 4
+    return values.mean(), np.median(values), values.min(), values.max()
+
+def compute_chart_aggregates(df):
+    """预先计算统计类图表和统计摘要使用的汇总结果，切换图表时不再重复扫描整个数据集"""
+    aggs = {'missing_cells': int(df.isna().to_numpy().sum())}
+    if '品牌' in df.columns:
+        brand_counts = df['品牌'].value_counts()
+        aggs['brand'] = brand_counts.head(15)
+        aggs['brand_total'] = len(brand_counts)
+    if '燃料类型' in df.columns:
+        aggs['fuel'] = df['燃料类型'].value_counts()
+    if '年份' in df.columns:
+        aggs['year'] = df['年份'].value_counts().sort_index()
+        aggs['year_summary'] = numeric_summary(df['年份'])
+    if '价格' in df.columns:
+        aggs['price_summary'] = numeric_summary(df['价格'])
+    if '价格区间' in df.columns:
+        aggs['price_pie'] = pie_slices(df['价格区间'].value_counts())
+    if '车辆类型' in df.columns and '里程' in df.columns:
+        # 按车辆类型首次出现的顺序分组，只统计样本数多于5的类型
+        aggs['mileage_box'] = []
+        for vtype, mileage in df.groupby('车辆类型', sort=False)['里程']:
+            mileage = mileage.dropna().to_numpy()
+            if len(mileage) > 5:
+                aggs['mileage_box'].append(box_stats(vtype, mileage))
+    return aggs
+
+class DataFrameTableModel(QAbstractTableModel):
+    """只读的DataFrame表格模型: 单元格文本、对齐和颜色在创建模型时按列一次算好，data()只做查表"""
+    
+    MAX_TEXT_LENGTH = 30  # 超过该长度的文本截断显示
+    
+    # data()对每个单元格的每种角色都会调用一次，枚举值和样式预先取出
+    # (PySide6中 Qt.DisplayRole 这类简写每次查找要数微秒)
+    _DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+    _ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+    _FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+    _NUMERIC_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    _NUMERIC_COLOR = QColor(0, 100, 200)
+    _MISSING_COLOR = QColor(150, 150, 150)
+    
+    def __init__(self, df, parent=None):
         super().__init__(parent)
-        
+        self._headers = [str(col) for col in df.columns]
+        self._row_count = len(df)
+        missing = df.isna().to_numpy()
+        
+        # 按列生成，取出的标量保持原类型(如float32按自身精度显示)
+        self._texts = []
+        self._alignments = []
+        self._foregrounds = []
+        for j, dtype in enumerate(df.dtypes):
+            numeric = pd.api.types.is_numeric_dtype(dtype)
+            column_missing = missing[:, j].tolist()
+            texts = [self._format(value) for value in df.iloc[:, j].to_numpy()]
+            if numeric:
+                # 数值字段的缺失值照常显示，只有有效值着色
+                colors = [None if m else self._NUMERIC_COLOR for m in column_missing]
+            else:
+                # 文本字段的缺失值显示为"--"并置灰
+                texts = ["--" if m else text for m, text in zip(column_missing, texts)]
+                colors = [self._MISSING_COLOR if m else None for m in column_missing]
+            self._texts.append(texts)
+            self._alignments.append(self._NUMERIC_ALIGNMENT if numeric else None)
+            self._foregrounds.append(colors)
+    
+    def _format(self, value):
+        """单元格显示文本，过长时截断"""
+        text = str(value)
+        if len(text) > self.MAX_TEXT_LENGTH:
+            text = text[:self.MAX_TEXT_LENGTH - 3] + "..."
+        return text
+    
+    def widest_row(self, column, metrics):
+        """该列显示文本最宽(按metrics测量)的行号"""
+        widths = [metrics.horizontalAdvance(text) for text in self._texts[column]]
+        return widths.index(max(widths))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == self._DISPLAY_ROLE and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == self._DISPLAY_ROLE:
+            return self._texts[index.column()][index.row()]
+        if role == self._ALIGNMENT_ROLE:
+            return self._alignments[index.column()]
+        if role == self._FOREGROUND_ROLE:
+            return self._foregrounds[index.column()][index.row()]
+        return None
+
+class ChartRenderer:
+    """图表绘制器: 持有matplotlib Figure，把各类图表渲染为QImage
+    
+    不依赖任何窗口部件，由ChartRenderThread在后台线程中使用
+    """
+    
+    def __init__(self):
         # 创建matplotlib图表
         self.figure = Figure(figsize=(12, 8), dpi=100)
-        
-        # 创建QLabel显示图片
-        self.chart_label = QLabel()
-        self.chart_label.setAlignment(Qt.AlignCenter)
-        self.chart_label.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #fafbfc);
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                padding: 20px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-            }
-        """)
-        
-        # 设置布局
-        layout = QVBoxLayout()
-        layout.addWidget(self.chart_label)
-        self.setLayout(layout)
+        # 直接在内存中光栅化，不经过PNG文件
+        self._agg = FigureCanvasAgg(self.figure)
+        self.image = None  # 最近一次渲染的结果
+        
+        # 单图表共用一个坐标轴，切换图表时只清空内容，不重建Axes
+        self._main_figure = self.figure
+        self.ax = self.figure.add_subplot(111)
+        self._current_kind = None
+        self._bars = []  # 当前柱状图的柱子及数值标签，同类图表重绘时原地更新
+        self._bar_texts = []
+        # 年份趋势图的折线、填充区域和不含二者的背景缓存，数据范围不变时只重绘这两个对象
+        self._trend_line = None
+        self._trend_fill = None
+        self._trend_background = None
+        # 模型效果图(2x2子图)单独使用一个Figure，首次绘制时创建
+        self._ml_figure = None
+        self._ml_axes = None
         
         # 设置背景颜色
         self.figure.patch.set_facecolor('white')
+    
+    def render(self):
+        """渲染当前Figure，结果保存到self.image"""
+        self._canvas().draw()
+        self._capture()
+    
+    def _canvas(self):
+        """当前Figure对应的Agg画布
         
-        # 显示欢迎信息
-        self.show_welcome()
+        单图表和模型效果图的Figure各自保留画布及其渲染缓冲区，来回切换时不重新创建
+        """
+        if not isinstance(self.figure.canvas, FigureCanvasAgg):
+            FigureCanvasAgg(self.figure)
+        self._agg = self.figure.canvas
+        return self._agg
     
-    def update_display(self):
-        """更新图表显示"""
-        try:
-            # 在保存前重新设置字体，确保所有文本都使用正确字体
-            for ax in self.figure.get_axes():
-                # 设置标题字体
-                if ax.get_title():
-                    ax.set_title(ax.get_title(), fontfamily='Microsoft YaHei', fontsize=14)
-                # 设置轴标签字体
-                if ax.get_xlabel():
-                    ax.set_xlabel(ax.get_xlabel(), fontfamily='Microsoft YaHei', fontsize=12)
-                if ax.get_ylabel():
-                    ax.set_ylabel(ax.get_ylabel(), fontfamily='Microsoft YaHei', fontsize=12)
-                
-                # 设置刻度标签字体
-                for label in ax.get_xticklabels():
-                    label.set_fontfamily('Microsoft YaHei')
-                    label.set_fontsize(10)
-                for label in ax.get_yticklabels():
-                    label.set_fontfamily('Microsoft YaHei')
-                    label.set_fontsize(10)
-                
-                # 设置图例字体
-                legend = ax.get_legend()
-                if legend:
-                    for text in legend.get_texts():
-                        text.set_fontfamily('Microsoft YaHei')
-                        text.set_fontsize(10)
-                
-                # 特别处理饼图等包含文本的图表
-                for text in ax.texts:
-                    text.set_fontfamily('Microsoft YaHei')
-                    text.set_fontsize(10)
-            
-            # 保存图表到临时文件
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                temp_path = tmp_file.name
-            
-            # 强制设置matplotlib的中文字体参数
-            import matplotlib.pyplot as plt
-            plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-            plt.rcParams['axes.unicode_minus'] = False
-            plt.rcParams['font.family'] = 'sans-serif'
-            
-            self.figure.savefig(temp_path, format='PNG', dpi=100, bbox_inches='tight',
-                              facecolor='white', edgecolor='none')
-            
-            # 加载并显示图片
-            pixmap = QPixmap(temp_path)
-            label_size = self.chart_label.size()
-            target_width = max(label_size.width() - 40, 800)
-            target_height = max(label_size.height() - 40, 600)
-            
-            scaled_pixmap = pixmap.scaled(target_width, target_height, 
-                                        Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.chart_label.setPixmap(scaled_pixmap)
-            
-            # 删除临时文件
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
-        except Exception as e:
-            self.chart_label.setText(f"图表显示错误: {str(e)}")
+    def _capture(self):
+        """把画布当前的像素复制为QImage，保存到self.image"""
+        # 直接用RGBA缓冲区构造图片
+        width, height = self._agg.get_width_height()
+        # 缓冲区在下次绘制时会被覆盖，复制后交给界面线程
+        self.image = QImage(self._agg.buffer_rgba(), width, height, QImage.Format_RGBA8888).copy()
+    
+    def _reset_axes(self, kind):
+        """切换到单图表Figure并清空坐标轴，返回可用于绘制的Axes"""
+        self.figure = self._main_figure
+        self.ax.cla()
+        # cla() 会保留上一个图表grid()设置的透明度，恢复为默认网格样式
+        self.ax.grid(plt.rcParams['axes.grid'], alpha=plt.rcParams['grid.alpha'])
+        # cla() 不会还原饼图等设置的长宽比、边框和背景色
+        self.ax.set_aspect('auto')
+        self.ax.set_frame_on(True)
+        self.ax.set_facecolor(plt.rcParams['axes.facecolor'])
+        # tight_layout() 的结果与起始位置有关，从默认边距开始保证同一图表每次绘制一致
+        self.figure.subplots_adjust(**{key: plt.rcParams[f'figure.subplot.{key}']
+                                       for key in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+        self._current_kind = kind
+        self._bars = []
+        self._bar_texts = []
+        self._trend_line = None
+        self._trend_fill = None
+        self._trend_background = None
+        return self.ax
+    
+    def _update_bars(self, kind, values, texts, text_offset=5):
+        """同类柱状图且柱子数量不变时，原地更新柱高和数值标签，返回是否已更新"""
+        if self._current_kind != kind or self.figure is not self._main_figure \
+                or len(self._bars) != len(values):
+            return False
+        for bar, label, value, text in zip(self._bars, self._bar_texts, values, texts):
+            bar.set_height(value)
+            label.set_y(value + text_offset)
+            label.set_text(text)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return True
+    
+    def _scatter(self, ax, x, y, s, color, alpha, label=None):
+        """绘制单色散点，点很多时改用栅格化的Line2D标记绘制
+        
+        Line2D的标记只渲染一次后逐点复制，比scatter的PathCollection逐点绘制快；
+        栅格化后导出PDF/SVG不再逐点输出图元，坐标轴和文字仍为矢量
+        """
+        if len(x) > SCATTER_MARKER_THRESHOLD:
+            ax.plot(x, y, linestyle='none', marker='o', markersize=np.sqrt(s),
+                    color=color, alpha=alpha, label=label, rasterized=True)
+        else:
+            ax.scatter(x, y, s=s, color=color, alpha=alpha, label=label)
     
     def show_welcome(self):
         """显示欢迎信息"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        ax = self._reset_axes('welcome')
         
         # 主标题
         ax.text(0.5, 0.7, '🚗 汽车数据可视化分析平台', 
                 ha='center', va='center', fontsize=24, fontweight='bold',
-                color='#667eea', fontfamily='Microsoft YaHei')
+                color='#667eea', fontproperties=CHINESE_FP)
         
         # 副标题
         ax.text(0.5, 0.5, '智能数据分析 · 专业图表展示 · AI建模预测', 
                 ha='center', va='center', fontsize=14,
-                color='#64748b', fontfamily='Microsoft YaHei')
+                color='#64748b', fontproperties=CHINESE_FP)
         
         # 操作提示
         ax.text(0.5, 0.3, '📂 点击"加载数据"开始您的数据分析之旅\n🎨 支持7种专业图表类型\n🤖 内置机器学习智能建模', 
                 ha='center', va='center', fontsize=12,
-                color='#374151', fontfamily='Microsoft YaHei',
+                color='#374151', fontproperties=CHINESE_FP,
                 bbox=dict(boxstyle='round,pad=1', facecolor='#f8fafc', 
                          edgecolor='#e2e8f0', alpha=0.8))
         
         # 版本信息
         ax.text(0.95, 0.05, 'v1.0.0', 
                 ha='right', va='bottom', fontsize=10,
-                color='#a0aec0', fontfamily='Microsoft YaHei')
+                color='#a0aec0', fontproperties=CHINESE_FP)
         
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
@@ -225,71 +496,52 @@ class ChartCanvas(QWidget):
         # 设置背景
         ax.set_facecolor('#ffffff')
         
-        self.update_display()
+        self.render()
     
-    def plot_brand_distribution(self, df):
+    def plot_brand_distribution(self, aggs):
         """品牌分布柱状图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        brand_counts = aggs['brand']
+        value_texts = [f'{value}' for value in brand_counts.values]
+        if self._update_bars('brand', brand_counts.values, value_texts):
+            self.ax.set_xticks(range(len(brand_counts)))
+            self.ax.set_xticklabels(brand_counts.index, rotation=45, ha='right')
+            self.figure.tight_layout()
+            self.render()
+            return
         
-        brand_counts = df['品牌'].value_counts().head(15)
+        ax = self._reset_axes('brand')
         colors = plt.cm.Set3(np.linspace(0, 1, len(brand_counts)))
         
         bars = ax.bar(range(len(brand_counts)), brand_counts.values, color=colors)
         ax.set_title('汽车品牌分布TOP15', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
-        ax.set_xlabel('品牌', fontsize=12, fontfamily='Microsoft YaHei')
-        ax.set_ylabel('数量 (辆)', fontsize=12, fontfamily='Microsoft YaHei')
+                    fontproperties=CHINESE_FP)
+        ax.set_xlabel('品牌', fontsize=12, fontproperties=CHINESE_FP)
+        ax.set_ylabel('数量 (辆)', fontsize=12, fontproperties=CHINESE_FP)
         ax.set_xticks(range(len(brand_counts)))
         ax.set_xticklabels(brand_counts.index, rotation=45, ha='right')
         
         # 添加数值标签
-        for bar, value in zip(bars, brand_counts.values):
+        for bar, text in zip(bars, value_texts):
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 5,
-                   f'{value}', ha='center', va='bottom', fontweight='bold')
+            self._bar_texts.append(ax.text(bar.get_x() + bar.get_width()/2., height + 5,
+                                           text, ha='center', va='bottom', fontweight='bold'))
+        self._bars = list(bars)
         
         ax.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        self.render()
     
-    def plot_price_distribution(self, df):
+    def plot_price_distribution(self, aggs):
         """价格分布饼图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        ax = self._reset_axes('price_pie')
         
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        price_counts = df['价格区间'].value_counts()
-        
-        # 只显示占比超过3%的价格区间，其余合并为"其他"
-        total_count = price_counts.sum()
-        main_categories = price_counts[price_counts / total_count >= 0.03]
-        other_count = price_counts[price_counts / total_count < 0.03].sum()
-        
-        # 如果有其他类别，添加到主要类别中
-        if other_count > 0:
-            main_categories['其他'] = other_count
-        
-        # 限制最多显示6个类别
-        if len(main_categories) > 6:
-            sorted_categories = main_categories.sort_values(ascending=False)
-            top_5 = sorted_categories.head(5)
-            others_sum = sorted_categories.tail(len(sorted_categories) - 5).sum()
-            if others_sum > 0:
-                top_5['其他'] = others_sum
-            main_categories = top_5
+        # 加载数据时已把占比过小的价格区间合并为"其他"
+        main_categories = aggs['price_pie']
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#FFB6C1', '#98FB98']
         
         # 创建饼图，添加阴影和分离效果
-        explode = [0.05 if cat == '其他' else 0.02 for cat in main_categories.index]  # 突出显示"其他"类别
+        explode = np.where(main_categories.index == '其他', 0.05, 0.02)  # 突出显示"其他"类别
         
         wedges, texts, autotexts = ax.pie(main_categories.values, labels=main_categories.index,
                                          autopct='%1.1f%%', startangle=90, colors=colors[:len(main_categories)],
@@ -297,117 +549,158 @@ class ChartCanvas(QWidget):
         
         # 显式设置所有文本的字体
         ax.set_title('价格区间分布', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
+                    fontproperties=CHINESE_FP)
         
         # 设置饼图标签字体
         for text in texts:
-            text.set_fontfamily('Microsoft YaHei')
+            text.set_fontproperties(CHINESE_FP)
             text.set_fontsize(11)
         
         # 设置百分比文本字体
         for autotext in autotexts:
-            autotext.set_fontfamily('Microsoft YaHei')
+            autotext.set_fontproperties(CHINESE_FP)
             autotext.set_fontsize(11)
             autotext.set_color('white')
             autotext.set_weight('bold')
         
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        self.render()
     
-    def plot_price_vs_year_scatter(self, df):
-        """价格vs年份散点图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+    def plot_price_vs_year_scatter(self, df, max_points=None):
+        """价格vs年份散点图，数据超过max_points条时随机抽样绘制"""
+        ax = self._reset_axes('price_year')
         
         # 清理数据
         data = df[['价格', '年份', '燃料类型']].dropna()
         
-        # 按燃料类型分组
+        # 按燃料类型分组 (颜色按全部数据分配，抽样后保持不变)
         fuel_types = data['燃料类型'].unique()
         colors = plt.cm.Set1(np.linspace(0, 1, len(fuel_types)))
         
+        title = '汽车价格与年份关系 (按燃料类型分组)'
+        if max_points and len(data) > max_points:
+            # 绘制耗时与点数成正比，点过多时图上也只是一片重叠
+            title += f'\n随机抽样 {max_points:,} / {len(data):,} 条'
+            data = data.sample(n=max_points, random_state=0)
+        
         for i, fuel in enumerate(fuel_types):
             fuel_data = data[data['燃料类型'] == fuel]
-            ax.scatter(fuel_data['年份'], fuel_data['价格'], 
-                      label=fuel, alpha=0.7, s=50, c=[colors[i]])
+            self._scatter(ax, fuel_data['年份'], fuel_data['价格'],
+                          label=fuel, alpha=0.7, s=50, color=colors[i])
         
-        ax.set_title('汽车价格与年份关系 (按燃料类型分组)', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
-        ax.set_xlabel('年份', fontsize=12, fontfamily='Microsoft YaHei')
-        ax.set_ylabel('价格 (万元)', fontsize=12, fontfamily='Microsoft YaHei')
+        ax.set_title(title, fontsize=16, fontweight='bold', pad=20,
+                    fontproperties=CHINESE_FP)
+        ax.set_xlabel('年份', fontsize=12, fontproperties=CHINESE_FP)
+        ax.set_ylabel('价格 (万元)', fontsize=12, fontproperties=CHINESE_FP)
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        self.render()
     
-    def plot_year_trend(self, df):
+    def plot_year_trend(self, aggs):
         """年份趋势折线图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        # 按年份统计的车辆数量
+        year_counts = aggs['year']
+        if self._blit_year_trend(year_counts):
+            return
         
-        # 按年份统计车辆数量
-        year_counts = df['年份'].value_counts().sort_index()
+        ax = self._reset_axes('year_trend')
         
-        ax.plot(year_counts.index, year_counts.values, 
-               marker='o', linewidth=3, markersize=8, color='#2E86AB')
-        ax.fill_between(year_counts.index, year_counts.values, alpha=0.3, color='#2E86AB')
+        line, = ax.plot(year_counts.index, year_counts.values, 
+                        marker='o', linewidth=3, markersize=8, color='#2E86AB')
+        fill = ax.fill_between(year_counts.index, year_counts.values, alpha=0.3, color='#2E86AB')
         
         ax.set_title('汽车年份分布趋势', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
-        ax.set_xlabel('年份', fontsize=12, fontfamily='Microsoft YaHei')
-        ax.set_ylabel('车辆数量', fontsize=12, fontfamily='Microsoft YaHei')
+                    fontproperties=CHINESE_FP)
+        ax.set_xlabel('年份', fontsize=12, fontproperties=CHINESE_FP)
+        ax.set_ylabel('车辆数量', fontsize=12, fontproperties=CHINESE_FP)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        
+        # 先隐藏折线、填充区域和边框完整绘制一次，缓存坐标区(含边框线宽)作为背景，再把它们画上去；
+        # 边框不留在背景里，否则重绘时会叠加两次
+        canvas = self._canvas()
+        front_artists = [line, fill, *ax.spines.values()]
+        for artist in front_artists:
+            artist.set_visible(False)
+        canvas.draw()
+        self._trend_background = canvas.copy_from_bbox(ax.bbox.padded(5))
+        for artist in front_artists:
+            artist.set_visible(True)
+        self._trend_line = line
+        self._trend_fill = fill
+        self._draw_trend_artists()
+        self._capture()
     
-    def plot_fuel_type_comparison(self, df):
-        """燃料类型对比柱状图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+    def _draw_trend_artists(self):
+        """在背景上依次绘制填充区域、折线，以及完整绘制时位于二者之上的边框"""
+        ax = self.ax
+        ax.draw_artist(self._trend_fill)
+        ax.draw_artist(self._trend_line)
+        for spine in ax.spines.values():
+            ax.draw_artist(spine)
+    
+    def _blit_year_trend(self, year_counts):
+        """年份相同且数量的最小/最大值不变(坐标范围不变)时，恢复背景后只重绘折线和填充区域
         
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        返回是否已完成绘制
+        """
+        line = self._trend_line
+        if self._current_kind != 'year_trend' or self.figure is not self._main_figure \
+                or self._trend_background is None:
+            return False
+        old_counts = line.get_ydata()
+        if not np.array_equal(line.get_xdata(), year_counts.index) \
+                or old_counts.min() != year_counts.min() or old_counts.max() != year_counts.max():
+            return False
+        
+        line.set_ydata(year_counts.values)
+        # 旧版matplotlib的填充区域不支持原地修改数据，直接替换
+        self._trend_fill.remove()
+        self._trend_fill = self.ax.fill_between(year_counts.index, year_counts.values,
+                                                alpha=0.3, color='#2E86AB')
+        self._agg.restore_region(self._trend_background)
+        self._draw_trend_artists()
+        self._capture()
+        return True
+    
+    def plot_fuel_type_comparison(self, aggs):
+        """燃料类型对比柱状图"""
+        fuel_counts = aggs['fuel']
+        total = fuel_counts.sum()
+        value_texts = [f'{value}\n({value / total * 100:.1f}%)' for value in fuel_counts.values]
+        if self._update_bars('fuel', fuel_counts.values, value_texts):
+            self.ax.set_xticks(range(len(fuel_counts)))
+            self.ax.set_xticklabels(fuel_counts.index)
+            self.figure.tight_layout()
+            self.render()
+            return
         
-        fuel_counts = df['燃料类型'].value_counts()
+        ax = self._reset_axes('fuel')
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
         
         bars = ax.bar(fuel_counts.index, fuel_counts.values, color=colors[:len(fuel_counts)])
         ax.set_title('燃料类型分布对比', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
-        ax.set_xlabel('燃料类型', fontsize=12, fontfamily='Microsoft YaHei')
-        ax.set_ylabel('车辆数量', fontsize=12, fontfamily='Microsoft YaHei')
+                    fontproperties=CHINESE_FP)
+        ax.set_xlabel('燃料类型', fontsize=12, fontproperties=CHINESE_FP)
+        ax.set_ylabel('车辆数量', fontsize=12, fontproperties=CHINESE_FP)
         
         # 添加百分比标签
-        total = fuel_counts.sum()
-        for bar, value in zip(bars, fuel_counts.values):
+        for bar, text in zip(bars, value_texts):
             height = bar.get_height()
-            percentage = (value / total) * 100
-            ax.text(bar.get_x() + bar.get_width()/2., height + 5,
-                   f'{value}\n({percentage:.1f}%)', ha='center', va='bottom', fontweight='bold')
+            self._bar_texts.append(ax.text(bar.get_x() + bar.get_width()/2., height + 5,
+                                           text, ha='center', va='bottom', fontweight='bold'))
+        self._bars = list(bars)
         
         ax.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        self.render()
     
     def plot_price_histogram(self, df):
         """价格分布直方图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        ax = self._reset_axes('price_hist')
         
         price_data = df['价格'].dropna()
         
@@ -419,35 +712,20 @@ class ChartCanvas(QWidget):
             patch.set_facecolor(plt.cm.viridis(i / len(patches)))
         
         ax.set_title('汽车价格分布直方图', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
-        ax.set_xlabel('价格 (万元)', fontsize=12, fontfamily='Microsoft YaHei')
-        ax.set_ylabel('车辆数量', fontsize=12, fontfamily='Microsoft YaHei')
+                    fontproperties=CHINESE_FP)
+        ax.set_xlabel('价格 (万元)', fontsize=12, fontproperties=CHINESE_FP)
+        ax.set_ylabel('车辆数量', fontsize=12, fontproperties=CHINESE_FP)
         ax.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        self.render()
     
-    def plot_mileage_boxplot(self, df):
+    def plot_mileage_boxplot(self, aggs):
         """里程箱线图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        # 按车辆类型分组的里程分布
-        vehicle_types = df['车辆类型'].unique()
-        box_data = []
-        labels = []
-        
-        for vtype in vehicle_types:
-            mileage_data = df[df['车辆类型'] == vtype]['里程'].dropna()
-            if len(mileage_data) > 5:
-                box_data.append(mileage_data)
-                labels.append(vtype)
+        ax = self._reset_axes('mileage_box')
         
-        bp = ax.boxplot(box_data, tick_labels=labels, patch_artist=True)
+        # 按车辆类型分组的里程分布，统计量已预先计算
+        bp = ax.bxp(aggs['mileage_box'], patch_artist=True)
         
         # 美化箱线图
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
@@ -456,37 +734,41 @@ class ChartCanvas(QWidget):
             patch.set_alpha(0.7)
         
         ax.set_title('不同车辆类型的里程分布', fontsize=16, fontweight='bold', pad=20,
-                    fontfamily='Microsoft YaHei')
-        ax.set_xlabel('车辆类型', fontsize=12, fontfamily='Microsoft YaHei')
-        ax.set_ylabel('里程 (公里)', fontsize=12, fontfamily='Microsoft YaHei')
+                    fontproperties=CHINESE_FP)
+        ax.set_xlabel('车辆类型', fontsize=12, fontproperties=CHINESE_FP)
+        ax.set_ylabel('里程 (公里)', fontsize=12, fontproperties=CHINESE_FP)
         ax.grid(True, alpha=0.3, axis='y')
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        self.update_display()
+        for label in ax.get_xticklabels():
+            label.set_rotation(45)
+            label.set_ha('right')
+        self.figure.tight_layout()
+        self.render()
     
     def plot_ml_price_prediction(self, y_test, y_pred, mae, r2):
         """绘制价格预测模型效果图"""
-        self.figure.clear()
-        
-        # 创建子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        # 2x2子图的Figure只创建一次，之后清空各子图重绘
+        if self._ml_figure is None:
+            self._ml_figure = Figure(figsize=(15, 12), dpi=100)
+            self._ml_figure.patch.set_facecolor('white')
+            self._ml_axes = self._ml_figure.subplots(2, 2)
+        fig = self._ml_figure
+        (ax1, ax2), (ax3, ax4) = self._ml_axes
+        for ax in fig.get_axes():
+            ax.cla()
+        self._current_kind = 'ml_prediction'
         
         # 1. 预测值vs真实值散点图
-        ax1.scatter(y_test, y_pred, alpha=0.6, color='#4ECDC4', s=30)
+        self._scatter(ax1, y_test, y_pred, alpha=0.6, color='#4ECDC4', s=30)
         
         # 添加理想预测线(y=x)
         min_val = min(min(y_test), min(y_pred))
         max_val = max(max(y_test), max(y_pred))
         ax1.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='理想预测线')
         
-        ax1.set_xlabel('真实价格 (万元)', fontfamily='Microsoft YaHei', fontsize=12)
-        ax1.set_ylabel('预测价格 (万元)', fontfamily='Microsoft YaHei', fontsize=12)
-        ax1.set_title('价格预测效果对比', fontfamily='Microsoft YaHei', fontsize=14, fontweight='bold')
+        ax1.set_xlabel('真实价格 (万元)', fontproperties=CHINESE_FP, fontsize=12)
+        ax1.set_ylabel('预测价格 (万元)', fontproperties=CHINESE_FP, fontsize=12)
+        ax1.set_title('价格预测效果对比', fontproperties=CHINESE_FP, fontsize=14, fontweight='bold')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
         
@@ -494,40 +776,36 @@ class ChartCanvas(QWidget):
         ax1.text(0.05, 0.95, f'MAE: {mae:.2f}万元\nR²: {r2:.3f}', 
                 transform=ax1.transAxes, fontsize=11, 
                 bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8),
-                verticalalignment='top', fontfamily='Microsoft YaHei')
+                verticalalignment='top', fontproperties=CHINESE_FP)
         
         # 2. 预测误差分布直方图
         errors = y_pred - y_test
+        _, rmse, mape, error_mean, error_std = residual_stats(y_test, y_pred)
         ax2.hist(errors, bins=30, alpha=0.7, color='#FF6B6B', edgecolor='white')
         ax2.axvline(x=0, color='black', linestyle='--', linewidth=2, label='零误差线')
-        ax2.set_xlabel('预测误差 (万元)', fontfamily='Microsoft YaHei', fontsize=12)
-        ax2.set_ylabel('频次', fontfamily='Microsoft YaHei', fontsize=12)
-        ax2.set_title('预测误差分布', fontfamily='Microsoft YaHei', fontsize=14, fontweight='bold')
+        ax2.set_xlabel('预测误差 (万元)', fontproperties=CHINESE_FP, fontsize=12)
+        ax2.set_ylabel('频次', fontproperties=CHINESE_FP, fontsize=12)
+        ax2.set_title('预测误差分布', fontproperties=CHINESE_FP, fontsize=14, fontweight='bold')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
         # 添加误差统计
-        ax2.text(0.05, 0.95, f'误差均值: {errors.mean():.2f}\n误差标准差: {errors.std():.2f}', 
+        ax2.text(0.05, 0.95, f'误差均值: {error_mean:.2f}\n误差标准差: {error_std:.2f}', 
                 transform=ax2.transAxes, fontsize=11,
                 bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8),
-                verticalalignment='top', fontfamily='Microsoft YaHei')
+                verticalalignment='top', fontproperties=CHINESE_FP)
         
         # 3. 残差图
-        ax3.scatter(y_pred, errors, alpha=0.6, color='#96CEB4', s=30)
+        self._scatter(ax3, y_pred, errors, alpha=0.6, color='#96CEB4', s=30)
         ax3.axhline(y=0, color='red', linestyle='--', linewidth=2)
-        ax3.set_xlabel('预测价格 (万元)', fontfamily='Microsoft YaHei', fontsize=12)
-        ax3.set_ylabel('残差 (万元)', fontfamily='Microsoft YaHei', fontsize=12)
-        ax3.set_title('残差分析图', fontfamily='Microsoft YaHei', fontsize=14, fontweight='bold')
+        ax3.set_xlabel('预测价格 (万元)', fontproperties=CHINESE_FP, fontsize=12)
+        ax3.set_ylabel('残差 (万元)', fontproperties=CHINESE_FP, fontsize=12)
+        ax3.set_title('残差分析图', fontproperties=CHINESE_FP, fontsize=14, fontweight='bold')
         ax3.grid(True, alpha=0.3)
         
         # 4. 模型性能评估指标
         ax4.axis('off')
         
-        # 计算更多评估指标
-        import numpy as np
-        mape = np.mean(np.abs((y_test - y_pred) / y_test)) * 100
-        rmse = np.sqrt(np.mean((y_test - y_pred) ** 2))
-        
         performance_text = f"""
 🎯 模型性能评估
 
@@ -551,27 +829,21 @@ class ChartCanvas(QWidget):
         """
         
         ax4.text(0.1, 0.9, performance_text, transform=ax4.transAxes, 
-                fontsize=12, fontfamily='Microsoft YaHei',
+                fontsize=12, fontproperties=CHINESE_FP,
                 bbox=dict(boxstyle='round,pad=1', facecolor='lightgreen', alpha=0.8),
                 verticalalignment='top')
         
         # 调整布局
-        plt.tight_layout(pad=3.0)
+        fig.tight_layout(pad=3.0)
         self.figure = fig
-        self.update_display()
+        self.render()
     
     def plot_ml_feature_importance(self, feature_importance, model_type):
         """绘制特征重要性图表"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # 强制设置中文字体
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        ax = self._reset_axes('feature_importance')
         
-        # 排序特征重要性
-        sorted_features = sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)
-        features, importances = zip(*sorted_features)
+        # 特征重要性已按从高到低排列
+        features, importances = zip(*feature_importance.items())
         
         # 创建颜色渐变
         colors = plt.cm.viridis(np.linspace(0, 1, len(features)))
@@ -581,15 +853,15 @@ class ChartCanvas(QWidget):
         
         # 设置标签
         ax.set_yticks(range(len(features)))
-        ax.set_yticklabels(features, fontfamily='Microsoft YaHei')
-        ax.set_xlabel('特征重要性', fontfamily='Microsoft YaHei', fontsize=12)
+        ax.set_yticklabels(features, fontproperties=CHINESE_FP)
+        ax.set_xlabel('特征重要性', fontproperties=CHINESE_FP, fontsize=12)
         ax.set_title(f'{model_type} - 特征重要性分析', 
-                    fontfamily='Microsoft YaHei', fontsize=14, fontweight='bold')
+                    fontproperties=CHINESE_FP, fontsize=14, fontweight='bold')
         
         # 添加数值标签
         for i, (bar, importance) in enumerate(zip(bars, importances)):
             ax.text(importance + 0.01, i, f'{importance:.3f}', 
-                   va='center', fontfamily='Microsoft YaHei', fontsize=10)
+                   va='center', fontproperties=CHINESE_FP, fontsize=10)
         
         # 美化图表
         ax.grid(True, alpha=0.3, axis='x')
@@ -604,24 +876,250 @@ class ChartCanvas(QWidget):
         """
         
         ax.text(0.02, 0.98, explanation, transform=ax.transAxes,
-               fontfamily='Microsoft YaHei', fontsize=10,
+               fontproperties=CHINESE_FP, fontsize=10,
                bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8),
                verticalalignment='top')
         
-        plt.tight_layout()
-        self.update_display()
+        self.figure.tight_layout()
+        self.render()
+
+class ChartRenderThread(QThread):
+    """图表渲染线程: 在后台绘制图表，连续提交多个请求时只绘制最新的一个
+    
+    每种图表保留最近一次的绘制结果，再次请求且参数是同一批对象(数据未变)时直接复用图片
+    """
+    chart_rendered = Signal(QImage, int)  # 图片, 请求编号
+    error_occurred = Signal(str, int)  # 错误信息, 请求编号
+    
+    def __init__(self):
+        super().__init__()
+        # Figure只在本线程中绘制，不使用pyplot的全局状态
+        self.renderer = ChartRenderer()
+        self.render_lock = threading.Lock()  # 绘制或导出Figure期间持有
+        self._condition = threading.Condition()
+        self._pending = None  # 尚未开始的最新请求: (绘制方法名, 参数, 请求编号)
+        self.last_request_id = 0  # 最近一次提交的请求编号
+        self._busy = False
+        self._stopped = False
+        self._images = {}  # 绘制方法名 -> (参数, 图片)
+        self._figure_request = None  # Figure中当前绘制的请求
+        self._shown_request = None  # 最近一次显示的请求(可能来自缓存，与Figure内容不同)
+    
+    def clear_cache(self):
+        """丢弃缓存的图片，数据更换后调用，同时释放对旧数据的引用"""
+        with self._condition:
+            self._images.clear()
+    
+    @staticmethod
+    def _same_args(args, other):
+        """参数是否为同一批对象 (按对象身份比较，不比较内容)"""
+        return len(args) == len(other) and all(a is b for a, b in zip(args, other))
+    
+    def _cached_image(self, method, args):
+        """同一图表、参数为同一批对象时返回缓存的图片"""
+        with self._condition:
+            cached = self._images.get(method)
+        if cached is not None and self._same_args(cached[0], args):
+            return cached[1]
+        return None
+    
+    def sync_figure(self):
+        """使Figure与界面上显示的图表一致(显示的是缓存图片时重新绘制)，需持有render_lock"""
+        shown, drawn = self._shown_request, self._figure_request
+        if shown is not None and (drawn is None or shown[0] != drawn[0]
+                                  or not self._same_args(shown[1], drawn[1])):
+            method, args = shown
+            getattr(self.renderer, method)(*args)
+            self._figure_request = self._shown_request
+    
+    def request(self, method, *args):
+        """提交绘制请求，覆盖尚未开始处理的旧请求，返回请求编号"""
+        with self._condition:
+            self.last_request_id += 1
+            self._pending = (method, args, self.last_request_id)
+            self._condition.notify_all()
+            return self.last_request_id
+    
+    def wait_idle(self):
+        """等待已提交的请求绘制完成"""
+        with self._condition:
+            while (self._pending is not None or self._busy) and not self._stopped:
+                self._condition.wait()
+    
+    def stop(self):
+        """停止线程，未处理的请求被丢弃"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self.wait()
+    
+    def run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                method, args, request_id = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                image = self._cached_image(method, args)
+                if image is None:
+                    with self.render_lock:
+                        self._figure_request = None  # 绘制失败时Figure内容不确定
+                        getattr(self.renderer, method)(*args)
+                        image = self.renderer.image
+                        self._figure_request = (method, args)
+                    with self._condition:
+                        self._images[method] = (args, image)
+                    self._shown_request = self._figure_request
+                else:
+                    self._shown_request = (method, args)
+                self.chart_rendered.emit(image, request_id)
+            except Exception as e:
+                self.error_occurred.emit(str(e), request_id)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+class ChartCanvas(QWidget):
+    """图表画布组件: 图表由后台线程绘制，完成后显示"""
+    chart_shown = Signal(int)  # 请求编号
+    render_failed = Signal(str, int)  # 错误信息, 请求编号
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._pixmap = None  # 未缩放的图表图片
+        self._last_size = None  # 上次缩放时的标签尺寸
+        
+        # 创建QLabel显示图片
+        self.chart_label = QLabel()
+        self.chart_label.setAlignment(Qt.AlignCenter)
+        self.chart_label.setObjectName("chartLabel")  # 样式见MAIN_STYLESHEET
+        
+        # 设置布局
+        layout = QVBoxLayout()
+        layout.addWidget(self.chart_label)
+        self.setLayout(layout)
+        
+        # 后台渲染线程，应用退出时停止
+        self.render_thread = ChartRenderThread()
+        self.render_thread.chart_rendered.connect(self.show_image)
+        self.render_thread.error_occurred.connect(self.on_render_error)
+        self.render_thread.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.render_thread.stop)
+        
+        # 显示欢迎信息
+        self.show_welcome()
+    
+    def show_image(self, image, request_id):
+        """显示渲染完成的图表"""
+        self._pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
+        self._last_size = None
+        self._show_scaled()
+        self.chart_shown.emit(request_id)
+    
+    def on_render_error(self, error_msg, request_id):
+        """图表渲染失败"""
+        self.chart_label.setText(f"图表显示错误: {error_msg}")
+        self.render_failed.emit(error_msg, request_id)
+    
+    def _show_scaled(self):
+        """按标签尺寸缩放显示当前图表，尺寸未变化时不重复缩放"""
+        label_size = self.chart_label.size()
+        if self._pixmap is None or label_size == self._last_size:
+            return
+        self._last_size = label_size
+        target_width = max(label_size.width() - 40, 800)
+        target_height = max(label_size.height() - 40, 600)
+        
+        scaled_pixmap = self._pixmap.scaled(target_width, target_height, 
+                                            Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.chart_label.setPixmap(scaled_pixmap)
+    
+    def resizeEvent(self, event):
+        """窗口尺寸变化时重新缩放已渲染的图表，无需重绘"""
+        super().resizeEvent(event)
+        self._show_scaled()
+    
+    def save_figure(self, file_path, **kwargs):
+        """等待正在进行的绘制完成后，把当前图表保存到文件"""
+        self.render_thread.wait_idle()
+        with self.render_thread.render_lock:
+            self.render_thread.sync_figure()
+            self.render_thread.renderer.figure.savefig(file_path, **kwargs)
+    
+    def show_welcome(self):
+        """显示欢迎信息"""
+        self.render_thread.request('show_welcome')
+    
+    def plot_brand_distribution(self, aggs):
+        """品牌分布柱状图"""
+        self.render_thread.request('plot_brand_distribution', aggs)
+    
+    def plot_price_distribution(self, aggs):
+        """价格分布饼图"""
+        self.render_thread.request('plot_price_distribution', aggs)
+    
+    def plot_price_vs_year_scatter(self, df, max_points=None):
+        """价格vs年份散点图"""
+        self.render_thread.request('plot_price_vs_year_scatter', df, max_points)
+    
+    def plot_year_trend(self, aggs):
+        """年份趋势折线图"""
+        self.render_thread.request('plot_year_trend', aggs)
+    
+    def plot_fuel_type_comparison(self, aggs):
+        """燃料类型对比柱状图"""
+        self.render_thread.request('plot_fuel_type_comparison', aggs)
+    
+    def plot_price_histogram(self, df):
+        """价格分布直方图"""
+        self.render_thread.request('plot_price_histogram', df)
+    
+    def plot_mileage_boxplot(self, aggs):
+        """里程箱线图"""
+        self.render_thread.request('plot_mileage_boxplot', aggs)
+    
+    def plot_ml_price_prediction(self, y_test, y_pred, mae, r2):
+        """价格预测模型效果图"""
+        self.render_thread.request('plot_ml_price_prediction', y_test, y_pred, mae, r2)
+    
+    def plot_ml_feature_importance(self, feature_importance, model_type):
+        """特征重要性图表"""
+        self.render_thread.request('plot_ml_feature_importance', feature_importance, model_type)
 
 class CarPredictionModel:
     """汽车数据预测模型"""
     
-    def __init__(self):
+    # 样本数超过该值时聚类改用小批量K-Means
+    MINIBATCH_THRESHOLD = 50000
+    
+    def __init__(self, n_estimators=100, max_samples=0.7):
         self.price_model = None
         self.category_model = None
         self.cluster_model = None
         self.label_encoders = {}
-        self.scaler = StandardScaler()
+        self.scaler = None
         self.is_trained = False
-        
+        # 随机森林参数: 树的数量及每棵树的抽样比例，训练和预测使用全部CPU核心
+        self.n_estimators = n_estimators
+        self.max_samples = max_samples
+        
+    @staticmethod
+    def _ranked_importance(feature_cols, importances):
+        """特征重要性字典，按重要性从高到低排列，报告和图表直接按顺序取用"""
+        return dict(sorted(zip(feature_cols, importances), key=lambda x: x[1], reverse=True))
+    
+    def _forest_params(self):
+        """随机森林的构造参数"""
+        return dict(n_estimators=self.n_estimators, max_samples=self.max_samples, n_jobs=-1, random_state=42)
+    
     def prepare_features(self, df):
         """准备特征数据"""
         # 选择有用的特征
@@ -638,26 +1136,33 @@ class CarPredictionModel:
         categorical_columns = X.select_dtypes(include=['object']).columns
         for col in categorical_columns:
             if col not in self.label_encoders:
+                from sklearn.preprocessing import LabelEncoder
                 self.label_encoders[col] = LabelEncoder()
                 X[col] = self.label_encoders[col].fit_transform(X[col].astype(str))
             else:
-                # 处理未见过的类别
-                X[col] = X[col].astype(str)
-                unique_values = X[col].unique()
-                for val in unique_values:
-                    if val not in self.label_encoders[col].classes_:
-                        # 对于未见过的类别，使用最常见的类别替代
-                        most_common = df[col].mode()[0] if not df[col].mode().empty else 'unknown'
-                        X.loc[X[col] == val, col] = most_common
-                X[col] = self.label_encoders[col].transform(X[col])
+                # 按已知类别一次性编码，未见过的类别编码为-1
+                encoder = self.label_encoders[col]
+                codes = pd.Categorical(X[col].astype(str), categories=encoder.classes_).codes
+                unknown_mask = codes == -1
+                if unknown_mask.any():
+                    # 对于未见过的类别，使用最常见的类别替代
+                    most_common = df[col].mode()[0] if not df[col].mode().empty else 'unknown'
+                    codes = codes.copy()
+                    codes[unknown_mask] = encoder.transform([most_common])[0]
+                X[col] = codes
         
         # 处理缺失值
         X = X.fillna(X.mean())
         
-        return X, available_columns
+        # 决策树内部按float32比较特征，直接提供连续的float32矩阵可免去fit/predict时的类型转换和复制
+        return np.ascontiguousarray(X.to_numpy(dtype=np.float32)), available_columns
     
     def train_price_prediction(self, df):
         """训练价格预测模型"""
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import mean_absolute_error, r2_score
+        
         if '价格' not in df.columns:
             raise ValueError("数据中没有价格字段")
         
@@ -669,8 +1174,7 @@ class CarPredictionModel:
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # 训练模型
-        self.price_model = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.price_model.fit(X_train, y_train)
+        self.price_model = fit_model(RandomForestRegressor, self._forest_params(), X_train, y_train)
         
         # 评估模型
         y_pred = self.price_model.predict(X_test)
@@ -678,7 +1182,7 @@ class CarPredictionModel:
         r2 = r2_score(y_test, y_pred)
         
         # 特征重要性
-        feature_importance = dict(zip(feature_cols, self.price_model.feature_importances_))
+        feature_importance = self._ranked_importance(feature_cols, self.price_model.feature_importances_)
         
         return {
             'mae': mae,
@@ -692,38 +1196,34 @@ class CarPredictionModel:
     
     def train_category_classification(self, df):
         """训练车辆分类模型"""
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.model_selection import train_test_split
+        
         if '价格' not in df.columns:
             raise ValueError("数据中没有价格字段用于分类")
         
-        # 根据价格创建分类标签
+        # 根据价格创建分类标签: 按33%/67%分位数整列划分，不逐行调用Python函数
         price_data = df['价格'].fillna(df['价格'].mean())
-        price_quantiles = price_data.quantile([0.33, 0.67])
-        
-        def categorize_price(price):
-            if price <= price_quantiles.iloc[0]:
-                return '经济型'
-            elif price <= price_quantiles.iloc[1]:
-                return '中档型'
-            else:
-                return '豪华型'
+        q_low, q_high = price_data.quantile([0.33, 0.67]).to_numpy()
+        prices = price_data.to_numpy()
         
         # 准备数据
         X, feature_cols = self.prepare_features(df)
-        y = price_data.apply(categorize_price)
+        y = pd.Series(np.select([prices <= q_low, prices <= q_high], ['经济型', '中档型'], '豪华型'),
+                      index=price_data.index)
         
         # 分割数据
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # 训练模型
-        self.category_model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.category_model.fit(X_train, y_train)
+        self.category_model = fit_model(RandomForestClassifier, self._forest_params(), X_train, y_train)
         
         # 评估模型
         y_pred = self.category_model.predict(X_test)
         accuracy = (y_pred == y_test).mean()
         
         # 特征重要性
-        feature_importance = dict(zip(feature_cols, self.category_model.feature_importances_))
+        feature_importance = self._ranked_importance(feature_cols, self.category_model.feature_importances_)
         
         return {
             'accuracy': accuracy,
@@ -734,6 +1234,9 @@ class CarPredictionModel:
     
     def train_clustering(self, df):
         """训练聚类模型"""
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.cluster import KMeans, MiniBatchKMeans
+        
         # 准备数值特征
         numeric_columns = ['价格', '年份', '里程', '车龄']
         available_numeric = [col for col in numeric_columns if col in df.columns]
@@ -743,21 +1246,26 @@ class CarPredictionModel:
         
         X = df[available_numeric].fillna(df[available_numeric].mean())
         
-        # 标准化
-        X_scaled = self.scaler.fit_transform(X)
+        # 标准化 (float32即可满足聚类精度，减少一半内存带宽)
+        self.scaler = StandardScaler()
+        X_scaled = self.scaler.fit_transform(X).astype(np.float32, copy=False)
         
-        # K-means聚类
-        self.cluster_model = KMeans(n_clusters=4, random_state=42)
+        # K-means聚类，数据量大时每次迭代只用一小批样本更新聚类中心
+        if len(X_scaled) > self.MINIBATCH_THRESHOLD:
+            self.cluster_model = MiniBatchKMeans(n_clusters=4, batch_size=1024, n_init=3, random_state=42)
+        else:
+            self.cluster_model = KMeans(n_clusters=4, random_state=42)
         clusters = self.cluster_model.fit_predict(X_scaled)
         
-        # 分析聚类结果
+        # 分析聚类结果: 一次分组统计各聚类的数量和平均价格
+        prices = df['价格'] if '价格' in df.columns else pd.Series(0.0, index=df.index)
+        stats = prices.groupby(clusters).agg(['size', 'mean']).reindex(range(4))
         cluster_analysis = {}
-        for i in range(4):
-            cluster_data = df[clusters == i]
+        for i, (count, mean_price) in enumerate(zip(stats['size'].fillna(0).astype(int), stats['mean'])):
             cluster_analysis[f'聚类{i+1}'] = {
-                '数量': len(cluster_data),
-                '平均价格': cluster_data['价格'].mean() if '价格' in cluster_data.columns else 0,
-                '特征': f"样本数: {len(cluster_data)}"
+                '数量': count,
+                '平均价格': mean_price,
+                '特征': f"样本数: {count}"
             }
         
         return {
@@ -783,9 +1291,13 @@ class CarPredictionModel:
 class DataLoadThread(QThread):
     """数据加载线程"""
     progress_updated = Signal(int)
-    data_loaded = Signal(pd.DataFrame)
+    data_loaded = Signal(pd.DataFrame, dict)
     error_occurred = Signal(str)
     
+    NUMERIC_COLUMNS = ['价格', '年份', '里程', '车龄']
+    FLOAT32_COLUMNS = {'价格': 'float32', '里程': 'float32'}  # 连续数值用单精度存储
+    EXCEL_SUFFIXES = ('.xlsx', '.xls')
+    
     def __init__(self, file_path):
         super().__init__()
         self.file_path = file_path
@@ -793,31 +1305,468 @@ class DataLoadThread(QThread):
     def run(self):
         try:
             self.progress_updated.emit(20)
-            df = pd.read_csv(self.file_path, encoding='utf-8-sig')
+            if self.file_path.lower().endswith(self.EXCEL_SUFFIXES):
+                # 安装了python-calamine时用calamine引擎，比默认的openpyxl快数倍
+                df = pd.read_excel(self.file_path, engine='calamine' if CALAMINE_AVAILABLE else None)
+            else:
+                try:
+                    # PyArrow的CSV解析器多线程一次解析整个文件，比C解析器分块读取快一倍
+                    df = pd.read_csv(self.file_path, encoding='utf-8-sig', engine='pyarrow')
+                except ValueError:
+                    # PyArrow无法解析的文件(如列数不一致的行)退回C解析器
+                    df = pd.read_csv(self.file_path, encoding='utf-8-sig')
+            
+            # 数据类型转换: 解析器已识别为数值的列直接使用，只强制转换含非数值内容的列
+            text_columns = [col for col in self.NUMERIC_COLUMNS
+                            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])]
+            if text_columns:
+                df[text_columns] = df[text_columns].apply(pd.to_numeric, errors='coerce')
+            df = df.astype({col: dtype for col, dtype in self.FLOAT32_COLUMNS.items() if col in df.columns})
             
             self.progress_updated.emit(60)
             # 数据清洗
             df = df.dropna(how='all')
             
             self.progress_updated.emit(80)
-            # 数据类型转换
-            df['价格'] = pd.to_numeric(df['价格'], errors='coerce')
-            df['年份'] = pd.to_numeric(df['年份'], errors='coerce')
-            df['里程'] = pd.to_numeric(df['里程'], errors='coerce')
-            df['车龄'] = pd.to_numeric(df['车龄'], errors='coerce')
+            aggs = compute_chart_aggregates(df)
             
             self.progress_updated.emit(100)
-            self.data_loaded.emit(df)
+            self.data_loaded.emit(df, aggs)
             
         except Exception as e:
             self.error_occurred.emit(str(e))
 
+# 主窗口样式表: 所有控件的样式集中在这里，启动时只设置一次
+# 各控件通过objectName选择器匹配(如 QLabel#dataInfoLabel)，不再各自调用setStyleSheet
+MAIN_STYLESHEET = """
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f8fafc, stop:1 #e2e8f0);
+        font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
+        font-size: 12px;
+    }
+
+    QGroupBox {
+        font-weight: 600;
+        font-size: 14px;
+        color: #1a202c;
+        border: 1px solid #e2e8f0;
+        border-radius: 12px;
+        margin-top: 20px;
+        padding-top: 20px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f7fafc);
+        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 20px;
+        padding: 8px 16px;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+        border-radius: 8px;
+        font-weight: 600;
+        font-size: 13px;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-weight: 600;
+        padding: 12px 24px;
+        font-size: 13px;
+        min-height: 20px;
+        letter-spacing: 0.5px;
+    }
+
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #5a67d8, stop:1 #6b46c1);
+        transform: translateY(-1px);
+        box-shadow: 0 4px 12px rgba(90, 103, 216, 0.4);
+    }
+
+    QPushButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4c51bf, stop:1 #553c9a);
+        transform: translateY(0px);
+    }
+
+    QPushButton:disabled {
+        background: #e2e8f0;
+        color: #a0aec0;
+        box-shadow: none;
+    }
+
+    QComboBox {
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        padding: 10px 15px;
+        background: white;
+        font-size: 13px;
+        min-width: 200px;
+        selection-background-color: #667eea;
+    }
+
+    QComboBox:focus {
+        border-color: #667eea;
+        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+    }
+
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 6px solid #667eea;
+        margin-right: 10px;
+    }
+
+    QTableView {
+        border: 1px solid #e2e8f0;
+        border-radius: 12px;
+        background-color: white;
+        gridline-color: #f1f5f9;
+        font-size: 12px;
+        alternate-background-color: #fafbfc;
+    }
+
+    QTableView::item {
+        padding: 12px;
+        border-bottom: 1px solid #f1f5f9;
+    }
+
+    QTableView::item:selected {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(102, 126, 234, 0.1), stop:1 rgba(118, 75, 162, 0.1));
+        color: #1a202c;
+    }
+
+    QHeaderView::section {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+        padding: 12px;
+        border: none;
+        font-weight: 600;
+        font-size: 12px;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    QTextEdit {
+        border: 1px solid #e2e8f0;
+        border-radius: 8px;
+        background-color: white;
+        font-size: 12px;
+        padding: 12px;
+        font-family: 'Consolas', 'Monaco', 'SF Mono', monospace;
+        line-height: 1.5;
+    }
+
+    QTabWidget::pane {
+        border: 1px solid #e2e8f0;
+        border-radius: 12px;
+        background-color: white;
+        margin-top: -1px;
+    }
+
+    QTabBar::tab {
+        background: transparent;
+        padding: 12px 24px;
+        margin-right: 4px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        font-weight: 500;
+        color: #64748b;
+        min-width: 100px;
+    }
+
+    QTabBar::tab:selected {
+        background: white;
+        color: #667eea;
+        border-bottom: 3px solid #667eea;
+        font-weight: 600;
+    }
+
+    QTabBar::tab:hover {
+        background: rgba(102, 126, 234, 0.05);
+        color: #667eea;
+    }
+
+    QProgressBar {
+        border: none;
+        border-radius: 10px;
+        background-color: #e2e8f0;
+        text-align: center;
+        font-weight: 600;
+        color: white;
+        height: 20px;
+    }
+
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        border-radius: 10px;
+        margin: 1px;
+    }
+
+    QLabel {
+        color: #2d3748;
+        font-size: 12px;
+        line-height: 1.5;
+    }
+
+    QSplitter::handle {
+        background-color: #e2e8f0;
+        width: 2px;
+        border-radius: 1px;
+    }
+
+    QSplitter::handle:hover {
+        background-color: #667eea;
+    }
+
+    QScrollBar:vertical {
+        background: #f1f5f9;
+        width: 12px;
+        border-radius: 6px;
+        margin: 0;
+    }
+
+    QScrollBar::handle:vertical {
+        background: #cbd5e0;
+        border-radius: 6px;
+        min-height: 20px;
+        margin: 2px;
+    }
+
+    QScrollBar::handle:vertical:hover {
+        background: #a0aec0;
+    }
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+        height: 0;
+    }
+
+    /* 工具栏 */
+    QFrame#toolbar {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8fafc);
+        border: 1px solid #e2e8f0;
+        border-radius: 15px;
+        padding: 8px;
+        margin-bottom: 5px;
+    }
+
+    QLabel#statusIndicator {
+        color: #64748b;
+        font-weight: 500;
+        font-size: 11px;
+        padding: 5px 10px;
+        background: rgba(255,255,255,0.8);
+        border-radius: 12px;
+        border: 1px solid #e2e8f0;
+    }
+
+    /* 左侧控制面板 */
+    QWidget#controlPanel {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8fafc);
+        border-radius: 15px;
+        border: 1px solid #e2e8f0;
+    }
+
+    QLabel#dataInfoLabel {
+        color: #64748b;
+        font-size: 12px;
+        line-height: 1.6;
+        padding: 8px;
+        background: rgba(102, 126, 234, 0.05);
+        border-radius: 8px;
+        border: 1px dashed #cbd5e0;
+    }
+
+    QLabel#dataInfoLabel[loaded="true"] {
+        color: #374151;
+        font-size: 11px;
+        line-height: 1.8;
+        padding: 15px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(102, 126, 234, 0.05), stop:1 rgba(118, 75, 162, 0.03));
+        border-radius: 10px;
+        border: 1px solid #e2e8f0;
+        font-family: 'Microsoft YaHei', sans-serif;
+    }
+
+    QLabel#chartTypeLabel {
+        font-weight: 600;
+        color: #374151;
+        font-size: 13px;
+        margin-bottom: 5px;
+    }
+
+    QPushButton#generateBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #10b981, stop:1 #059669);
+        font-weight: 600;
+        letter-spacing: 0.5px;
+    }
+    QPushButton#generateBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #059669, stop:1 #047857);
+    }
+
+    QTextEdit#statsText {
+        background: #fafbfc;
+        border: 1px solid #f1f5f9;
+        border-radius: 8px;
+        padding: 12px;
+        font-family: 'Microsoft YaHei', sans-serif;
+        font-size: 11px;
+        line-height: 1.5;
+        color: #374151;
+    }
+
+    /* 右侧可视化区域 */
+    QWidget#vizWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8fafc);
+        border-radius: 15px;
+        border: 1px solid #e2e8f0;
+    }
+
+    QTabWidget#mainTabs::pane {
+        border: 1px solid #e2e8f0;
+        border-radius: 12px;
+        background-color: white;
+        margin-top: 5px;
+    }
+
+    QTabWidget#mainTabs QTabBar::tab {
+        background: transparent;
+        padding: 15px 25px;
+        margin-right: 6px;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+        font-weight: 500;
+        color: #64748b;
+        min-width: 120px;
+        font-size: 13px;
+    }
+
+    QTabWidget#mainTabs QTabBar::tab:selected {
+        background: white;
+        color: #667eea;
+        border-bottom: 3px solid #667eea;
+        font-weight: 600;
+    }
+
+    QTabWidget#mainTabs QTabBar::tab:hover {
+        background: rgba(102, 126, 234, 0.08);
+        color: #667eea;
+    }
+
+    QLabel#chartLabel {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #fafbfc);
+        border: 1px solid #e2e8f0;
+        border-radius: 12px;
+        padding: 20px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+    }
+
+    QLabel#tableHeader, QLabel#mlHeader {
+        font-size: 16px;
+        font-weight: 600;
+        color: #374151;
+        padding: 10px 0;
+        border-bottom: 2px solid #e2e8f0;
+        margin-bottom: 15px;
+    }
+
+    QTableView#dataTable {
+        border: 1px solid #e2e8f0;
+        border-radius: 8px;
+        background-color: white;
+        gridline-color: #f1f5f9;
+        font-size: 11px;
+        alternate-background-color: #fafbfc;
+    }
+
+    QTableView#dataTable::item {
+        padding: 10px;
+        border-bottom: 1px solid #f1f5f9;
+    }
+
+    QTableView#dataTable::item:selected {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(102, 126, 234, 0.1), stop:1 rgba(118, 75, 162, 0.1));
+        color: #1a202c;
+    }
+
+    QTableView#dataTable QHeaderView::section {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+        padding: 12px;
+        border: none;
+        font-weight: 600;
+        font-size: 11px;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    QTextEdit#mlResults {
+        background: #fafbfc;
+        border: 1px solid #f1f5f9;
+        border-radius: 8px;
+        padding: 20px;
+        font-family: 'Microsoft YaHei', sans-serif;
+        font-size: 12px;
+        line-height: 1.8;
+        color: #374151;
+    }
+
+    /* 状态栏 */
+    QStatusBar#statusBar {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8fafc);
+        border-top: 1px solid #e2e8f0;
+        padding: 5px;
+        font-size: 11px;
+        color: #64748b;
+    }
+    QStatusBar#statusBar QLabel {
+        font-size: 11px;
+        color: #64748b;
+        padding: 2px 8px;
+        font-weight: 500;
+    }
+"""
+
 class CarDataVisualizer(QMainWindow):
     """汽车数据可视化主窗口"""
     
     def __init__(self):
         super().__init__()
         self.df = None
+        self.chart_aggs = {}  # 加载数据时预先计算的图表统计结果
+        self.chart_downsample = 20000  # 散点图最多绘制的点数，None表示不抽样
+        self._chart_notice = None  # 等待绘制完成后提示的图表: (请求编号, 图表名称)
         self.ml_model = CarPredictionModel() if ML_AVAILABLE else None
         self.init_ui()
         self.setup_connections()
@@ -868,16 +1817,6 @@ class CarDataVisualizer(QMainWindow):
         """创建工具栏"""
         toolbar = QFrame()
         toolbar.setObjectName("toolbar")
-        toolbar.setStyleSheet("""
-            QFrame#toolbar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8fafc);
-                border: 1px solid #e2e8f0;
-                border-radius: 15px;
-                padding: 8px;
-                margin-bottom: 5px;
-            }
-        """)
         
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(15, 10, 15, 10)
@@ -935,17 +1874,7 @@ class CarDataVisualizer(QMainWindow):
         
         # 状态指示器
         self.status_indicator = QLabel("🔴 未连接")
-        self.status_indicator.setStyleSheet("""
-            QLabel {
-                color: #64748b;
-                font-weight: 500;
-                font-size: 11px;
-                padding: 5px 10px;
-                background: rgba(255,255,255,0.8);
-                border-radius: 12px;
-                border: 1px solid #e2e8f0;
-            }
-        """)
+        self.status_indicator.setObjectName("statusIndicator")
         
         status_layout.addWidget(self.progress_bar)
         status_layout.addWidget(self.status_indicator)
@@ -961,14 +1890,6 @@ class CarDataVisualizer(QMainWindow):
         """创建左侧控制面板"""
         control_widget = QWidget()
         control_widget.setObjectName("controlPanel")
-        control_widget.setStyleSheet("""
-            QWidget#controlPanel {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8fafc);
-                border-radius: 15px;
-                border: 1px solid #e2e8f0;
-            }
-        """)
         
         control_layout = QVBoxLayout(control_widget)
         control_layout.setContentsMargins(15, 15, 15, 15)
@@ -982,17 +1903,7 @@ class CarDataVisualizer(QMainWindow):
         
         self.data_info_label = QLabel("🔍 请加载汽车数据文件开始分析")
         self.data_info_label.setWordWrap(True)
-        self.data_info_label.setStyleSheet("""
-            QLabel {
-                color: #64748b;
-                font-size: 12px;
-                line-height: 1.6;
-                padding: 8px;
-                background: rgba(102, 126, 234, 0.05);
-                border-radius: 8px;
-                border: 1px dashed #cbd5e0;
-            }
-        """)
+        self.data_info_label.setObjectName("dataInfoLabel")
         info_layout.addWidget(self.data_info_label)
         
         control_layout.addWidget(info_group)
@@ -1005,54 +1916,40 @@ class CarDataVisualizer(QMainWindow):
         
         # 图表类型标签
         chart_label = QLabel("🎨 选择图表类型:")
-        chart_label.setStyleSheet("""
-            QLabel {
-                font-weight: 600;
-                color: #374151;
-                font-size: 13px;
-                margin-bottom: 5px;
-            }
-        """)
+        chart_label.setObjectName("chartTypeLabel")
         chart_layout.addWidget(chart_label)
         
         self.chart_combo = QComboBox()
-        chart_items = [
-            "品牌分布 (柱状图)",
-            "价格分布 (饼图)", 
-            "价格vs年份 (散点图)",
-            "年份趋势 (折线图)",
-            "燃料类型对比 (柱状图)",
-            "价格分布 (直方图)",
-            "里程分布 (箱线图)"
+        # 图表选项: (显示文本, 绘制方法, 是否需要先训练模型)，绘制方法为None的是分隔项
+        # 生成图表时按下标直接取出绘制方法
+        chart_options = [
+            ("品牌分布 (柱状图)", lambda: self.chart_canvas.plot_brand_distribution(self.chart_aggs), False),
+            ("价格分布 (饼图)", lambda: self.chart_canvas.plot_price_distribution(self.chart_aggs), False),
+            ("价格vs年份 (散点图)",
+             lambda: self.chart_canvas.plot_price_vs_year_scatter(self.df, max_points=self.chart_downsample), False),
+            ("年份趋势 (折线图)", lambda: self.chart_canvas.plot_year_trend(self.chart_aggs), False),
+            ("燃料类型对比 (柱状图)", lambda: self.chart_canvas.plot_fuel_type_comparison(self.chart_aggs), False),
+            ("价格分布 (直方图)", lambda: self.chart_canvas.plot_price_histogram(self.df), False),
+            ("里程分布 (箱线图)", lambda: self.chart_canvas.plot_mileage_boxplot(self.chart_aggs), False),
         ]
         
         # 如果机器学习可用，添加ML图表选项
         if ML_AVAILABLE:
-            chart_items.extend([
-                "--- 智能分析 ---",
-                "价格预测效果图",
-                "特征重要性分析"
+            chart_options.extend([
+                ("--- 智能分析 ---", None, False),
+                ("价格预测效果图", self.plot_price_prediction_chart, True),
+                ("特征重要性分析", self.plot_feature_importance_chart, True),
             ])
         
-        self.chart_combo.addItems(chart_items)
+        self.chart_combo.addItems([text for text, _, _ in chart_options])
+        self.chart_handlers = [(plot, needs_model) for _, plot, needs_model in chart_options]
         chart_layout.addWidget(self.chart_combo)
         
         # 生成图表按钮
         self.generate_btn = QPushButton("🎨 生成可视化图表")
         self.generate_btn.setMinimumHeight(42)
         self.generate_btn.setEnabled(False)
-        self.generate_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #10b981, stop:1 #059669);
-                font-weight: 600;
-                letter-spacing: 0.5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #059669, stop:1 #047857);
-            }
-        """)
+        self.generate_btn.setObjectName("generateBtn")
         chart_layout.addWidget(self.generate_btn)
         
         control_layout.addWidget(chart_group)
@@ -1065,18 +1962,7 @@ class CarDataVisualizer(QMainWindow):
         self.stats_text = QTextEdit()
         self.stats_text.setMaximumHeight(220)
         self.stats_text.setPlainText("📈 数据加载后将显示详细统计信息和趋势分析...")
-        self.stats_text.setStyleSheet("""
-            QTextEdit {
-                background: #fafbfc;
-                border: 1px solid #f1f5f9;
-                border-radius: 8px;
-                padding: 12px;
-                font-family: 'Microsoft YaHei', sans-serif;
-                font-size: 11px;
-                line-height: 1.5;
-                color: #374151;
-            }
-        """)
+        self.stats_text.setObjectName("statsText")
         stats_layout.addWidget(self.stats_text)
         
         control_layout.addWidget(stats_group)
@@ -1088,14 +1974,6 @@ class CarDataVisualizer(QMainWindow):
         """创建右侧可视化区域"""
         viz_widget = QWidget()
         viz_widget.setObjectName("vizWidget")
-        viz_widget.setStyleSheet("""
-            QWidget#vizWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8fafc);
-                border-radius: 15px;
-                border: 1px solid #e2e8f0;
-            }
-        """)
         
         viz_layout = QVBoxLayout(viz_widget)
         viz_layout.setContentsMargins(15, 15, 15, 15)
@@ -1103,38 +1981,7 @@ class CarDataVisualizer(QMainWindow):
         
         # 标签页容器
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                background-color: white;
-                margin-top: 5px;
-            }
-            
-            QTabBar::tab {
-                background: transparent;
-                padding: 15px 25px;
-                margin-right: 6px;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                font-weight: 500;
-                color: #64748b;
-                min-width: 120px;
-                font-size: 13px;
-            }
-            
-            QTabBar::tab:selected {
-                background: white;
-                color: #667eea;
-                border-bottom: 3px solid #667eea;
-                font-weight: 600;
-            }
-            
-            QTabBar::tab:hover {
-                background: rgba(102, 126, 234, 0.08);
-                color: #667eea;
-            }
-        """)
+        self.tab_widget.setObjectName("mainTabs")
         
         # 图表标签页
         chart_tab = QWidget()
@@ -1154,54 +2001,13 @@ class CarDataVisualizer(QMainWindow):
         
         # 表格头部信息
         table_header = QLabel("📋 数据表格浏览")
-        table_header.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: 600;
-                color: #374151;
-                padding: 10px 0;
-                border-bottom: 2px solid #e2e8f0;
-                margin-bottom: 15px;
-            }
-        """)
+        table_header.setObjectName("tableHeader")
         table_layout.addWidget(table_header)
         
-        self.data_table = QTableWidget()
+        self.data_table = QTableView()
         self.data_table.setAlternatingRowColors(True)
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.data_table.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                background-color: white;
-                gridline-color: #f1f5f9;
-                font-size: 11px;
-                alternate-background-color: #fafbfc;
-            }
-            
-            QTableWidget::item {
-                padding: 10px;
-                border-bottom: 1px solid #f1f5f9;
-            }
-            
-            QTableWidget::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(102, 126, 234, 0.1), stop:1 rgba(118, 75, 162, 0.1));
-                color: #1a202c;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                padding: 12px;
-                border: none;
-                font-weight: 600;
-                font-size: 11px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-        """)
+        self.data_table.setSelectionBehavior(QTableView.SelectRows)
+        self.data_table.setObjectName("dataTable")
         table_layout.addWidget(self.data_table)
         
         self.tab_widget.addTab(table_tab, "📋 数据表格")
@@ -1214,16 +2020,7 @@ class CarDataVisualizer(QMainWindow):
             
             # ML头部信息
             ml_header = QLabel("🤖 智能建模分析")
-            ml_header.setStyleSheet("""
-                QLabel {
-                    font-size: 16px;
-                    font-weight: 600;
-                    color: #374151;
-                    padding: 10px 0;
-                    border-bottom: 2px solid #e2e8f0;
-                    margin-bottom: 15px;
-                }
-            """)
+            ml_header.setObjectName("mlHeader")
             ml_layout.addWidget(ml_header)
             
             # 模型结果显示
@@ -1245,18 +2042,7 @@ class CarDataVisualizer(QMainWindow):
 
 ⭐ 等待数据加载完成后开始您的AI之旅...""")
             
-            self.ml_results.setStyleSheet("""
-                QTextEdit {
-                    background: #fafbfc;
-                    border: 1px solid #f1f5f9;
-                    border-radius: 8px;
-                    padding: 20px;
-                    font-family: 'Microsoft YaHei', sans-serif;
-                    font-size: 12px;
-                    line-height: 1.8;
-                    color: #374151;
-                }
-            """)
+            self.ml_results.setObjectName("mlResults")
             ml_layout.addWidget(self.ml_results)
             
             self.tab_widget.addTab(ml_tab, "🤖 智能建模")
@@ -1267,22 +2053,7 @@ class CarDataVisualizer(QMainWindow):
     def create_status_bar(self):
         """创建状态栏"""
         self.status_bar = self.statusBar()
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8fafc);
-                border-top: 1px solid #e2e8f0;
-                padding: 5px;
-                font-size: 11px;
-                color: #64748b;
-            }
-            QStatusBar QLabel {
-                font-size: 11px;
-                color: #64748b;
-                padding: 2px 8px;
-                font-weight: 500;
-            }
-        """)
+        self.status_bar.setObjectName("statusBar")
         
         self.status_label = QLabel("🚗 系统就绪 - 请加载汽车数据文件")
         self.status_bar.addWidget(self.status_label)
@@ -1295,237 +2066,13 @@ class CarDataVisualizer(QMainWindow):
         self.update_time()
         self.status_bar.addPermanentWidget(self.time_label)
         
-        # 定时器
+        # 定时器: 只在窗口可见且未最小化时运行，见 update_clock_timer()
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
     
     def apply_styles(self):
         """应用现代化简约样式"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8fafc, stop:1 #e2e8f0);
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-            
-            QGroupBox {
-                font-weight: 600;
-                font-size: 14px;
-                color: #1a202c;
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                margin-top: 20px;
-                padding-top: 20px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f7fafc);
-                box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 20px;
-                padding: 8px 16px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-                padding: 12px 24px;
-                font-size: 13px;
-                min-height: 20px;
-                letter-spacing: 0.5px;
-            }
-            
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5a67d8, stop:1 #6b46c1);
-                transform: translateY(-1px);
-                box-shadow: 0 4px 12px rgba(90, 103, 216, 0.4);
-            }
-            
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4c51bf, stop:1 #553c9a);
-                transform: translateY(0px);
-            }
-            
-            QPushButton:disabled {
-                background: #e2e8f0;
-                color: #a0aec0;
-                box-shadow: none;
-            }
-            
-            QComboBox {
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 10px 15px;
-                background: white;
-                font-size: 13px;
-                min-width: 200px;
-                selection-background-color: #667eea;
-            }
-            
-            QComboBox:focus {
-                border-color: #667eea;
-                box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #667eea;
-                margin-right: 10px;
-            }
-            
-            QTableWidget {
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                background-color: white;
-                gridline-color: #f1f5f9;
-                font-size: 12px;
-                alternate-background-color: #fafbfc;
-            }
-            
-            QTableWidget::item {
-                padding: 12px;
-                border-bottom: 1px solid #f1f5f9;
-            }
-            
-            QTableWidget::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(102, 126, 234, 0.1), stop:1 rgba(118, 75, 162, 0.1));
-                color: #1a202c;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                padding: 12px;
-                border: none;
-                font-weight: 600;
-                font-size: 12px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            QTextEdit {
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                background-color: white;
-                font-size: 12px;
-                padding: 12px;
-                font-family: 'Consolas', 'Monaco', 'SF Mono', monospace;
-                line-height: 1.5;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                background-color: white;
-                margin-top: -1px;
-            }
-            
-            QTabBar::tab {
-                background: transparent;
-                padding: 12px 24px;
-                margin-right: 4px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-weight: 500;
-                color: #64748b;
-                min-width: 100px;
-            }
-            
-            QTabBar::tab:selected {
-                background: white;
-                color: #667eea;
-                border-bottom: 3px solid #667eea;
-                font-weight: 600;
-            }
-            
-            QTabBar::tab:hover {
-                background: rgba(102, 126, 234, 0.05);
-                color: #667eea;
-            }
-            
-            QProgressBar {
-                border: none;
-                border-radius: 10px;
-                background-color: #e2e8f0;
-                text-align: center;
-                font-weight: 600;
-                color: white;
-                height: 20px;
-            }
-            
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-radius: 10px;
-                margin: 1px;
-            }
-            
-            QLabel {
-                color: #2d3748;
-                font-size: 12px;
-                line-height: 1.5;
-            }
-            
-            QSplitter::handle {
-                background-color: #e2e8f0;
-                width: 2px;
-                border-radius: 1px;
-            }
-            
-            QSplitter::handle:hover {
-                background-color: #667eea;
-            }
-            
-            QScrollBar:vertical {
-                background: #f1f5f9;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: #cbd5e0;
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background: #a0aec0;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0;
-            }
-        """)
+        self.setStyleSheet(MAIN_STYLESHEET)
     
     def setup_connections(self):
         """设置信号连接"""
@@ -1533,6 +2080,8 @@ class CarDataVisualizer(QMainWindow):
         self.generate_btn.clicked.connect(self.generate_chart)
         self.export_btn.clicked.connect(self.export_chart)
         self.overview_btn.clicked.connect(self.show_overview)
+        self.chart_canvas.chart_shown.connect(self.on_chart_shown)
+        self.chart_canvas.render_failed.connect(self.on_chart_error)
         if ML_AVAILABLE:
             self.ml_btn.clicked.connect(self.run_machine_learning)
     
@@ -1540,7 +2089,7 @@ class CarDataVisualizer(QMainWindow):
         """加载数据"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择汽车数据文件", "", 
-            "CSV文件 (*.csv);;Excel文件 (*.xlsx);;所有文件 (*.*)"
+            "CSV文件 (*.csv *.csv.gz);;Excel文件 (*.xlsx);;所有文件 (*.*)"
         )
         
         if file_path:
@@ -1554,15 +2103,16 @@ class CarDataVisualizer(QMainWindow):
             self.load_thread.error_occurred.connect(self.on_load_error)
             self.load_thread.start()
     
-    def on_data_loaded(self, df):
+    def on_data_loaded(self, df, aggs):
         """数据加载完成"""
         self.df = df
+        self.chart_aggs = aggs
+        self.chart_canvas.render_thread.clear_cache()
         self.progress_bar.setVisible(False)
         
-        # 更新界面
-        self.update_data_info()
-        self.update_data_table()
-        self.update_statistics()
+        # 数据概况、表格和统计信息分阶段放到事件循环中执行，
+        # 按钮和状态栏先完成重绘、弹出提示，不必等全部面板填充完
+        self._run_panel_updates([self.update_data_info, self.update_data_table, self.update_statistics])
         
         # 启用按钮
         self.generate_btn.setEnabled(True)
@@ -1576,8 +2126,24 @@ class CarDataVisualizer(QMainWindow):
         self.status_label.setText("✅ 数据加载完成，可以开始分析")
         self.data_status.setText(f"数据: {len(self.df):,}行×{len(self.df.columns)}列")
         
-        QMessageBox.information(self, "✅ 加载成功", 
-                               f"🎉 汽车数据加载成功！\n\n📊 数据规模:\n• 记录数: {len(self.df):,} 条\n• 字段数: {len(self.df.columns)} 个\n\n🚀 现在可以开始生成图表和AI建模分析了！")
+        # 用open()非阻塞地弹出提示: 不进入嵌套事件循环，本函数立即返回
+        loaded_dialog = QMessageBox(self)
+        loaded_dialog.setWindowTitle("✅ 加载成功")
+        loaded_dialog.setText(f"🎉 汽车数据加载成功！\n\n📊 数据规模:\n• 记录数: {len(self.df):,} 条\n• 字段数: {len(self.df.columns)} 个\n\n🚀 现在可以开始生成图表和AI建模分析了！")
+        loaded_dialog.setIcon(QMessageBox.Information)
+        loaded_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        loaded_dialog.open()
+    
+    def _run_panel_updates(self, updates):
+        """依次执行界面更新: 每次只执行一项，其余投递回事件循环，期间界面可以重绘和响应操作"""
+        if not updates:
+            return
+        
+        def run_next():
+            updates[0]()
+            self._run_panel_updates(updates[1:])
+        
+        QTimer.singleShot(0, run_next)
     
     def on_load_error(self, error_msg):
         """数据加载错误"""
@@ -1590,35 +2156,38 @@ class CarDataVisualizer(QMainWindow):
         if self.df is None:
             return
         
+        # 各项指标只计算一次: 字段类型按dtypes统计，缺失值取加载时的整表统计
+        n_rows, n_cols = self.df.shape
+        dtypes = self.df.dtypes
+        n_numeric = sum(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                        for dtype in dtypes)
+        n_text = sum(pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype)
+                     for dtype in dtypes)
+        total_missing = self.chart_aggs['missing_cells']
+        total_cells = n_rows * n_cols
+        completeness = (total_cells - total_missing) / total_cells * 100 if total_cells else 0.0
+        
         info_text = f"""📊 数据集概览
 
 🎯 规模统计
-• 数据记录: {len(self.df):,} 条
-• 字段数量: {len(self.df.columns)} 个
-• 数值字段: {len(self.df.select_dtypes(include=[np.number]).columns)} 个
-• 文本字段: {len(self.df.select_dtypes(include=['object']).columns)} 个
+• 数据记录: {n_rows:,} 条
+• 字段数量: {n_cols} 个
+• 数值字段: {n_numeric} 个
+• 文本字段: {n_text} 个
 
 💎 质量指标
-• 数据完整率: {((len(self.df) * len(self.df.columns) - self.df.isnull().sum().sum()) / (len(self.df) * len(self.df.columns)) * 100):.1f}%
-• 缺失值数量: {self.df.isnull().sum().sum():,} 个
+• 数据完整率: {completeness:.1f}%
+• 缺失值数量: {total_missing:,} 个
 
 📋 字段列表
-{', '.join(self.df.columns.tolist()[:6])}{'...' if len(self.df.columns) > 6 else ''}"""
+{', '.join(self.df.columns.tolist()[:6])}{'...' if n_cols > 6 else ''}"""
         
         self.data_info_label.setText(info_text)
-        self.data_info_label.setStyleSheet("""
-            QLabel {
-                color: #374151;
-                font-size: 11px;
-                line-height: 1.8;
-                padding: 15px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(102, 126, 234, 0.05), stop:1 rgba(118, 75, 162, 0.03));
-                border-radius: 10px;
-                border: 1px solid #e2e8f0;
-                font-family: 'Microsoft YaHei', sans-serif;
-            }
-        """)
+        # 切换到"已加载"样式: 属性变化后需重新polish，并通知边框宽度(padding)已改变
+        self.data_info_label.setProperty("loaded", True)
+        self.data_info_label.style().unpolish(self.data_info_label)
+        self.data_info_label.style().polish(self.data_info_label)
+        QApplication.sendEvent(self.data_info_label, QEvent(QEvent.StyleChange))
     
     def update_data_table(self):
         """更新数据表格"""
@@ -1629,81 +2198,73 @@ class CarDataVisualizer(QMainWindow):
         display_rows = min(100, len(self.df))
         display_df = self.df.head(display_rows)
         
-        self.data_table.setRowCount(len(display_df))
-        self.data_table.setColumnCount(len(display_df.columns))
-        self.data_table.setHorizontalHeaderLabels(display_df.columns.tolist())
-        
-        # 填充数据
-        for i in range(len(display_df)):
-            for j, col in enumerate(display_df.columns):
-                value = display_df.iloc[i, j]
-                display_value = str(value)
-                
-                if len(display_value) > 30:
-                    display_value = display_value[:27] + "..."
-                
-                item = QTableWidgetItem(display_value)
-                
-                if display_df[col].dtype in ['int64', 'float64']:
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    if pd.notna(value):
-                        item.setForeground(QColor(0, 100, 200))
-                elif pd.isna(value):
-                    item.setText("--")
-                    item.setForeground(QColor(150, 150, 150))
-                
-                self.data_table.setItem(i, j, item)
-        
-        # 调整列宽
-        self.data_table.resizeColumnsToContents()
-        
-        # 限制最大列宽
-        for j in range(self.data_table.columnCount()):
-            current_width = self.data_table.columnWidth(j)
-            if current_width > 200:
-                self.data_table.setColumnWidth(j, 200)
-            elif current_width < 100:
-                self.data_table.setColumnWidth(j, 100)
+        # 表格模型按需生成单元格文本，替换后释放旧模型
+        old_model = self.data_table.model()
+        model = DataFrameTableModel(display_df, self.data_table)
+        self.data_table.setModel(model)
+        if old_model is not None:
+            old_model.deleteLater()
+        
+        # 调整列宽: 与 resizeColumnsToContents() 结果相同，但每列只让委托测量
+        # 文本最宽的一个单元格，不逐个测量全部单元格; 列宽限制在100~200之间
+        header = self.data_table.horizontalHeader()
+        metrics = self.data_table.fontMetrics()
+        grid_width = 1 if self.data_table.showGrid() else 0
+        for j in range(model.columnCount()):
+            width = header.sectionSizeHint(j)
+            if model.rowCount():
+                index = model.index(model.widest_row(j, metrics), j)
+                width = max(width, self.data_table.sizeHintForIndex(index).width() + grid_width)
+            self.data_table.setColumnWidth(j, min(max(width, 100), 200))
     
     def update_statistics(self):
         """更新统计信息"""
         if self.df is None:
             return
         
-        stats_text = "📊 汽车数据统计摘要:\n\n"
+        # 逐行收集后一次拼接，空字符串表示段落之间的空行
+        lines = ["📊 汽车数据统计摘要:", ""]
+        # 计数和数值汇总在加载线程中已经算好，这里只负责拼接文本
+        aggs = self.chart_aggs
         
         # 品牌统计
-        if '品牌' in self.df.columns:
-            brand_count = self.df['品牌'].nunique()
-            top_brands = self.df['品牌'].value_counts().head(3)
-            stats_text += f"🚗 品牌统计:\n"
-            stats_text += f"• 品牌总数: {brand_count} 个\n"
-            stats_text += f"• TOP3品牌: {', '.join(top_brands.index.tolist())}\n\n"
+        if 'brand' in aggs:
+            lines += [
+                "🚗 品牌统计:",
+                f"• 品牌总数: {aggs['brand_total']} 个",
+                f"• TOP3品牌: {', '.join(aggs['brand'].head(3).index.tolist())}",
+                "",
+            ]
         
         # 价格统计
-        if '价格' in self.df.columns:
-            price_data = self.df['价格'].dropna()
-            stats_text += f"💰 价格统计:\n"
-            stats_text += f"• 平均价格: {price_data.mean():.1f} 万元\n"
-            stats_text += f"• 价格中位数: {price_data.median():.1f} 万元\n"
-            stats_text += f"• 价格范围: {price_data.min():.1f} - {price_data.max():.1f} 万元\n\n"
+        if 'price_summary' in aggs:
+            price_mean, price_median, price_min, price_max = aggs['price_summary']
+            lines += [
+                "💰 价格统计:",
+                f"• 平均价格: {price_mean:.1f} 万元",
+                f"• 价格中位数: {price_median:.1f} 万元",
+                f"• 价格范围: {price_min:.1f} - {price_max:.1f} 万元",
+                "",
+            ]
         
         # 年份统计
-        if '年份' in self.df.columns:
-            year_data = self.df['年份'].dropna()
-            stats_text += f"📅 年份统计:\n"
-            stats_text += f"• 年份范围: {year_data.min():.0f} - {year_data.max():.0f}\n"
-            stats_text += f"• 平均年份: {year_data.mean():.0f}\n\n"
+        if 'year_summary' in aggs:
+            year_mean, _, year_min, year_max = aggs['year_summary']
+            lines += [
+                "📅 年份统计:",
+                f"• 年份范围: {year_min:.0f} - {year_max:.0f}",
+                f"• 平均年份: {year_mean:.0f}",
+                "",
+            ]
         
         # 燃料类型统计
-        if '燃料类型' in self.df.columns:
-            fuel_counts = self.df['燃料类型'].value_counts()
-            stats_text += f"⛽ 燃料类型:\n"
-            for fuel, count in fuel_counts.head(4).items():
+        if 'fuel' in aggs:
+            lines.append("⛽ 燃料类型:")
+            for fuel, count in aggs['fuel'].head(4).items():
                 percentage = count / len(self.df) * 100
-                stats_text += f"• {fuel}: {count}辆 ({percentage:.1f}%)\n"
+                lines.append(f"• {fuel}: {count}辆 ({percentage:.1f}%)")
         
-        self.stats_text.setPlainText(stats_text)
+        self.stats_text.setPlainText("\n".join(lines) + "\n")
     
     def generate_chart(self):
         """生成图表"""
@@ -1712,53 +2273,44 @@ class CarDataVisualizer(QMainWindow):
             return
         
         chart_type = self.chart_combo.currentText()
+        plot, needs_model = self.chart_handlers[self.chart_combo.currentIndex()]
         
-        try:
-            if "品牌分布" in chart_type:
-                self.chart_canvas.plot_brand_distribution(self.df)
-            elif "价格分布" in chart_type and "饼图" in chart_type:
-                self.chart_canvas.plot_price_distribution(self.df)
-            elif "价格vs年份" in chart_type:
-                self.chart_canvas.plot_price_vs_year_scatter(self.df)
-            elif "年份趋势" in chart_type:
-                self.chart_canvas.plot_year_trend(self.df)
-            elif "燃料类型对比" in chart_type:
-                self.chart_canvas.plot_fuel_type_comparison(self.df)
-            elif "价格分布" in chart_type and "直方图" in chart_type:
-                self.chart_canvas.plot_price_histogram(self.df)
-            elif "里程分布" in chart_type:
-                self.chart_canvas.plot_mileage_boxplot(self.df)
-            elif "价格预测效果图" in chart_type:
-                if hasattr(self, 'price_prediction_results'):
-                    self.chart_canvas.plot_ml_price_prediction(
-                        self.price_prediction_results['y_test'],
-                        self.price_prediction_results['y_pred'],
-                        self.price_prediction_results['mae'],
-                        self.price_prediction_results['r2']
-                    )
-                else:
-                    QMessageBox.warning(self, "提示", "请先运行智能建模生成价格预测模型")
-                    return
-            elif "特征重要性分析" in chart_type:
-                if hasattr(self, 'price_prediction_results'):
-                    self.chart_canvas.plot_ml_feature_importance(
-                        self.price_prediction_results['feature_importance'],
-                        self.price_prediction_results['model_type']
-                    )
-                else:
-                    QMessageBox.warning(self, "提示", "请先运行智能建模生成价格预测模型")
-                    return
-            elif "--- 智能分析 ---" in chart_type:
-                QMessageBox.information(self, "提示", "请选择具体的智能分析图表类型")
-                return
-            
-            # 切换到图表标签页
-            self.tab_widget.setCurrentIndex(0)
-            
+        if plot is None:
+            QMessageBox.information(self, "提示", "请选择具体的智能分析图表类型")
+            return
+        if needs_model and not hasattr(self, 'price_prediction_results'):
+            QMessageBox.warning(self, "提示", "请先运行智能建模生成价格预测模型")
+            return
+        
+        # 图表在后台线程中绘制，绘制完成并显示后再提示成功(见on_chart_shown)
+        plot()
+        self._chart_notice = (self.chart_canvas.render_thread.last_request_id, chart_type)
+        
+        # 切换到图表标签页
+        self.tab_widget.setCurrentIndex(0)
+    
+    def plot_price_prediction_chart(self):
+        """绘制价格预测效果图"""
+        results = self.price_prediction_results
+        self.chart_canvas.plot_ml_price_prediction(results['y_test'], results['y_pred'], results['mae'], results['r2'])
+    
+    def plot_feature_importance_chart(self):
+        """绘制特征重要性图表"""
+        results = self.price_prediction_results
+        self.chart_canvas.plot_ml_feature_importance(results['feature_importance'], results['model_type'])
+    
+    def on_chart_shown(self, request_id):
+        """后台绘制的图表已显示，是"生成图表"提交的请求时提示成功"""
+        if self._chart_notice is not None and self._chart_notice[0] == request_id:
+            chart_type = self._chart_notice[1]
+            self._chart_notice = None
             QMessageBox.information(self, "✅ 图表生成成功", f"🎨 {chart_type} 生成完成！")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "❌ 生成失败", f"图表生成失败:\n{str(e)}")
+    
+    def on_chart_error(self, error_msg, request_id):
+        """后台绘制图表失败"""
+        if self._chart_notice is not None and self._chart_notice[0] == request_id:
+            self._chart_notice = None
+        QMessageBox.critical(self, "❌ 生成失败", f"图表生成失败:\n{error_msg}")
     
     def export_chart(self):
         """导出图表"""
@@ -1773,8 +2325,8 @@ class CarDataVisualizer(QMainWindow):
         
         if file_path:
             try:
-                self.chart_canvas.figure.savefig(file_path, dpi=300, bbox_inches='tight',
-                                               facecolor='white', edgecolor='none')
+                self.chart_canvas.save_figure(file_path, dpi=300, bbox_inches='tight',
+                                              facecolor='white', edgecolor='none')
                 QMessageBox.information(self, "✅ 导出成功", f"图表已保存到:\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "❌ 导出失败", f"导出失败:\n{str(e)}")
@@ -1785,32 +2337,55 @@ class CarDataVisualizer(QMainWindow):
             QMessageBox.warning(self, "提示", "请先加载数据")
             return
         
-        overview_text = f"""📊 汽车数据概览报告
-
-📈 数据规模:
-• 总记录数: {len(self.df):,} 条
-• 字段数量: {len(self.df.columns)} 个
-• 数据完整率: {((len(self.df) * len(self.df.columns) - self.df.isnull().sum().sum()) / (len(self.df) * len(self.df.columns)) * 100):.1f}%
-
-🚗 品牌分析:
-• 品牌总数: {self.df['品牌'].nunique()} 个
-• 热门品牌: {', '.join(self.df['品牌'].value_counts().head(5).index.tolist())}
-
-💰 价格分析:
-• 平均价格: {self.df['价格'].mean():.1f} 万元
-• 价格中位数: {self.df['价格'].median():.1f} 万元
-• 价格范围: {self.df['价格'].min():.1f} - {self.df['价格'].max():.1f} 万元
-
-📅 年份分析:
-• 年份范围: {self.df['年份'].min():.0f} - {self.df['年份'].max():.0f}
-• 平均年份: {self.df['年份'].mean():.0f}
-
-⛽ 燃料类型分布:"""
+        # 汇总结果在加载数据时已经算好，随数据一起替换，打开概览不再扫描整个数据集
+        aggs = self.chart_aggs
+        total_cells = len(self.df) * len(self.df.columns)
+        
+        # 与统计信息面板相同，逐段收集后一次拼接，缺少对应字段的段落直接跳过
+        lines = [
+            "📊 汽车数据概览报告",
+            "",
+            "📈 数据规模:",
+            f"• 总记录数: {len(self.df):,} 条",
+            f"• 字段数量: {len(self.df.columns)} 个",
+            f"• 数据完整率: {((total_cells - aggs['missing_cells']) / total_cells * 100):.1f}%",
+            "",
+        ]
+        
+        if 'brand' in aggs:
+            lines += [
+                "🚗 品牌分析:",
+                f"• 品牌总数: {aggs['brand_total']} 个",
+                f"• 热门品牌: {', '.join(aggs['brand'].head(5).index.tolist())}",
+                "",
+            ]
+        
+        if 'price_summary' in aggs:
+            price_mean, price_median, price_min, price_max = aggs['price_summary']
+            lines += [
+                "💰 价格分析:",
+                f"• 平均价格: {price_mean:.1f} 万元",
+                f"• 价格中位数: {price_median:.1f} 万元",
+                f"• 价格范围: {price_min:.1f} - {price_max:.1f} 万元",
+                "",
+            ]
+        
+        if 'year_summary' in aggs:
+            year_mean, _, year_min, year_max = aggs['year_summary']
+            lines += [
+                "📅 年份分析:",
+                f"• 年份范围: {year_min:.0f} - {year_max:.0f}",
+                f"• 平均年份: {year_mean:.0f}",
+                "",
+            ]
+        
+        if 'fuel' in aggs:
+            lines.append("⛽ 燃料类型分布:")
+            for fuel, count in aggs['fuel'].items():
+                percentage = count / len(self.df) * 100
+                lines.append(f"• {fuel}: {count}辆 ({percentage:.1f}%)")
         
-        fuel_counts = self.df['燃料类型'].value_counts()
-        for fuel, count in fuel_counts.items():
-            percentage = count / len(self.df) * 100
-            overview_text += f"\n• {fuel}: {count}辆 ({percentage:.1f}%)"
+        overview_text = "\n".join(lines)
         
         # 创建概览对话框
         overview_dialog = QMessageBox(self)
@@ -1825,6 +2400,28 @@ class CarDataVisualizer(QMainWindow):
         current_time = datetime.now().strftime("%H:%M:%S")
         self.time_label.setText(f"🕐 {current_time}")
     
+    def update_clock_timer(self):
+        """窗口隐藏或最小化时停止时钟定时器，恢复显示时立即刷新并重新启动"""
+        if self.isVisible() and not self.isMinimized():
+            if not self.timer.isActive():
+                self.update_time()
+                self.timer.start(1000)
+        else:
+            self.timer.stop()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_clock_timer()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_clock_timer()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_clock_timer()
+    
     def run_machine_learning(self):
         """运行机器学习分析"""
         if self.df is None:
@@ -1854,9 +2451,8 @@ class CarDataVisualizer(QMainWindow):
                 
                 # 特征重要性
                 results_text += "\n🎯 特征重要性排名:\n"
-                sorted_features = sorted(price_results['feature_importance'].items(), 
-                                       key=lambda x: x[1], reverse=True)
-                for i, (feature, importance) in enumerate(sorted_features[:5], 1):
+                top_features = list(price_results['feature_importance'].items())[:5]
+                for i, (feature, importance) in enumerate(top_features, 1):
                     results_text += f"  {i}. {feature}: {importance:.3f}\n"
                 results_text += "\n"
                 
@@ -1880,9 +2476,8 @@ class CarDataVisualizer(QMainWindow):
                 
                 # 特征重要性
                 results_text += "\n🎯 分类特征重要性:\n"
-                sorted_features = sorted(category_results['feature_importance'].items(), 
-                                       key=lambda x: x[1], reverse=True)
-                for i, (feature, importance) in enumerate(sorted_features[:5], 1):
+                top_features = list(category_results['feature_importance'].items())[:5]
+                for i, (feature, importance) in enumerate(top_features, 1):
                     results_text += f"  {i}. {feature}: {importance:.3f}\n"
                 results_text += "\n"
                 
@@ -1907,6 +2502,8 @@ class CarDataVisualizer(QMainWindow):
             except Exception as e:
                 results_text += f"❌ 聚类分析失败: {str(e)}\n\n"
             
+            trim_model_cache()
+            
             # 4. 应用建议
             self.progress_bar.setValue(90)
             results_text += "💡 智能建议:\n"